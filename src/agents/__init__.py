@@ -22,6 +22,7 @@ from .test_execution_agent import (
     TestExecutionOutput,
 )
 from .reporting_agent import ReportingAgent, ReportingInput, ReportingOutput
+from .orchestrator import run_pipeline
 
 __all__ = [
     "BaseAgent",
@@ -42,4 +43,5 @@ __all__ = [
     "ReportingAgent",
     "ReportingInput",
     "ReportingOutput",
+    "run_pipeline",
 ]
@@ -0,0 +1,210 @@
+# /src/agents/_cache.py
+
+"""Plan-level memoization of agent outputs keyed by an input fingerprint."""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import os
+import sqlite3
+import time
+import typing
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Tuple, Type
+
+import orjson
+
+from .base_agent import AgentInput, AgentOutput
+from ._pool import run_in_pool
+
+# Set to "1" to bypass the cache entirely, e.g. for correctness testing
+DISABLE_ENV = "KAT_RBC_DISABLE_CACHE"
+# Directory holding the cache database
+CACHE_DIR_ENV = "KAT_RBC_CACHE_DIR"
+# Maximum number of cached outputs kept before least recently used eviction
+MAX_ENTRIES = 256
+# Extra text folded into every key, e.g. the identity of a model backing the
+# agents, so switching it invalidates outputs produced by the previous one
+SALT_ENV = "KAT_RBC_CACHE_SALT"
+# Bump when cached payloads change meaning without a source change
+CACHE_VERSION = 1
+
+# Root of the source tree whose content versions the cached outputs
+_SOURCE_ROOT = Path(__file__).resolve().parent.parent
+
+
+@functools.lru_cache(maxsize=1)
+def _code_version() -> str:
+    """Digest the source tree, so upgrading the code invalidates the cache."""
+    digest = hashlib.blake2b(digest_size=20)
+    for path in sorted(_SOURCE_ROOT.rglob("*.py")):
+        digest.update(str(path.relative_to(_SOURCE_ROOT)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _cache_path() -> Path:
+    """Resolve the location of the cache database."""
+    base = os.environ.get(CACHE_DIR_ENV) or Path.home() / ".cache" / "kat-rbc"
+    return Path(base) / "agents.sqlite"
+
+
+@contextlib.contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    """Open a transaction on the cache database, creating it on first use."""
+    path = _cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS agent_output_cache (
+            key TEXT PRIMARY KEY,
+            payload BLOB NOT NULL,
+            last_used REAL NOT NULL
+        )
+        """)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def fingerprint(agent_name: str, input_data: AgentInput, extra: Any = None) -> str:
+    """
+    Compute a stable fingerprint for an agent invocation.
+
+    Besides the invocation itself, the fingerprint covers the cache version,
+    the source code and the salt from the environment, so outputs cached
+    before an upgrade are never returned.
+
+    Args:
+        agent_name: Qualified name of the agent class
+        input_data: Input passed to the agent
+        extra: Optional JSON-serializable data that also affects the output
+
+    Returns:
+        Hex digest identifying the invocation
+    """
+    document = {
+        "version": CACHE_VERSION,
+        "code": _code_version(),
+        "salt": os.environ.get(SALT_ENV, ""),
+        "agent": agent_name,
+        "input": input_data.model_dump(mode="json"),
+        "extra": extra,
+    }
+    encoded = orjson.dumps(document, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+def _lookup(key: str, output_class: Type[AgentOutput]) -> Optional[AgentOutput]:
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT payload FROM agent_output_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(
+            "UPDATE agent_output_cache SET last_used = ? WHERE key = ?",
+            (time.time(), key),
+        )
+    return output_class.from_bytes(row[0])
+
+
+def _store(key: str, output: AgentOutput) -> None:
+    with _connect() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO agent_output_cache (key, payload, last_used) VALUES (?, ?, ?)",
+            (key, output.to_bytes(), time.time()),
+        )
+        conn.execute(
+            """
+            DELETE FROM agent_output_cache WHERE key NOT IN (
+                SELECT key FROM agent_output_cache ORDER BY last_used DESC LIMIT ?
+            )
+            """,
+            (MAX_ENTRIES,),
+        )
+
+
+def cache_agent(
+    func: Optional[Callable] = None,
+    *,
+    key_extra: Optional[Callable[[AgentInput], Any]] = None,
+) -> Callable:
+    """
+    Memoize an agent's run or run_async method on disk.
+
+    The output of a previous invocation with an identical input is returned
+    without re-running the agent. Cache failures never break the agent; they
+    are reported and the agent runs normally. Only agents without side
+    effects beyond their output may be cached.
+
+    Args:
+        func: Agent method taking (self, input_data), sync or async
+        key_extra: Optional callable returning extra data to fold into the
+            cache key, e.g. the modification time of a file named in the input
+
+    Returns:
+        Decorated method
+    """
+
+    def decorator(method: Callable) -> Callable:
+        # Cached payloads are JSON, so the declared return type rebuilds them
+        output_class = typing.get_type_hints(method)["return"]
+
+        def lookup(self, input_data: AgentInput) -> Tuple[Optional[str], Any]:
+            key = None
+            try:
+                extra = key_extra(input_data) if key_extra else None
+                key = fingerprint(type(self).__qualname__, input_data, extra)
+                return key, _lookup(key, output_class)
+            except Exception as e:
+                print(f"Error in agent cache lookup: {e}")
+                return key, None
+
+        def store(key: Optional[str], output: AgentOutput) -> None:
+            if key is None:
+                return
+            try:
+                _store(key, output)
+            except Exception as e:
+                print(f"Error in agent cache store: {e}")
+
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(self, input_data: AgentInput) -> AgentOutput:
+                if os.environ.get(DISABLE_ENV) == "1":
+                    return await method(self, input_data)
+
+                # The database is blocking, so it's only touched from the pool
+                key, cached = await run_in_pool(lookup, self, input_data)
+                if cached is not None:
+                    return cached
+
+                output = await method(self, input_data)
+                await run_in_pool(store, key, output)
+                return output
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, input_data: AgentInput) -> AgentOutput:
+            if os.environ.get(DISABLE_ENV) == "1":
+                return method(self, input_data)
+
+            key, cached = lookup(self, input_data)
+            if cached is not None:
+                return cached
+
+            output = method(self, input_data)
+            store(key, output)
+            return output
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
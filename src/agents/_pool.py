@@ -0,0 +1,71 @@
+# /src/agents/_pool.py
+
+"""Thread pool shared by every agent for blocking tool calls."""
+
+import asyncio
+import atexit
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, TypeVar
+
+R = TypeVar("R")
+
+# Overrides the pool size, which defaults to all but two CPU cores
+MAX_WORKERS_ENV = "KAT_RBC_MAX_WORKERS"
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv(MAX_WORKERS_ENV) or max(1, (os.cpu_count() or 1) - 2)),
+    thread_name_prefix="kat-rbc-agent",
+)
+atexit.register(_EXECUTOR.shutdown)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor used by agents."""
+    return _EXECUTOR
+
+
+async def run_in_pool(func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """
+    Run a blocking callable on the shared executor from async code.
+
+    Callables submitted here must not themselves wait on work submitted to
+    the same pool, or a saturated pool could deadlock.
+
+    Args:
+        func: Blocking callable to run
+        *args: Positional arguments for ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        Result of ``func``
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def run_sync(coro: Coroutine[Any, Any, R]) -> R:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Inside a running event loop ``asyncio.run`` refuses to start, so the
+    coroutine then runs on a loop of its own in a separate thread, which
+    blocks the caller until it is done. That thread is not taken from the
+    shared pool, since the coroutine typically submits work to it.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Result of ``coro``
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, coro).result()
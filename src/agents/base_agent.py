@@ -1,8 +1,18 @@
 # /src/agents/base_agent.py
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar
+import orjson
 from pydantic import BaseModel
+from ._pool import run_in_pool
+
+T = TypeVar("T")
+R = TypeVar("R")
+OutputT = TypeVar("OutputT", bound="AgentOutput")
+
+# Default upper bound on concurrent tool calls fanned out by an agent
+MAX_PARALLEL = 8
 
 
 class AgentInput(BaseModel):
@@ -14,17 +24,61 @@ class AgentInput(BaseModel):
 class AgentOutput(BaseModel):
     """Base class for agent outputs"""
 
-    pass
+    def to_bytes(self) -> bytes:
+        """Serialize the output to JSON bytes for caches and worker boundaries"""
+        return orjson.dumps(self.model_dump(mode="json"))
+
+    @classmethod
+    def from_bytes(cls: Type[OutputT], data: bytes) -> OutputT:
+        """Rebuild an output previously serialized with to_bytes"""
+        return cls.model_validate(orjson.loads(data))
 
 
 class BaseAgent(ABC):
     """Base agent that all other agents will inherit from"""
 
+    max_parallel: int = MAX_PARALLEL
+
     @abstractmethod
     def run(self, input_data: AgentInput) -> AgentOutput:
         """Execute the agent's main functionality"""
         pass
 
+    async def run_async(self, input_data: AgentInput) -> AgentOutput:
+        """Execute the agent without blocking the running event loop"""
+        return await run_in_pool(self.run, input_data)
+
+    async def _gather_bounded(
+        self, func: Callable[[T], R], items: Iterable[T]
+    ) -> List[R]:
+        """
+        Apply a blocking callable to every item concurrently.
+
+        At most ``max_parallel`` calls are in flight at once and results are
+        returned in input order. If any call fails, the first exception is
+        re-raised once all calls have settled.
+
+        Args:
+            func: Synchronous callable, typically a tool's ``run`` method
+            items: Inputs to pass to ``func`` one at a time
+
+        Returns:
+            List of results in the same order as ``items``
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        async def _call(item: T) -> R:
+            async with semaphore:
+                return await run_in_pool(func, item)
+
+        results = await asyncio.gather(
+            *(_call(item) for item in items), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
     def __call__(self, input_data: AgentInput) -> AgentOutput:
         """Allow the agent to be called like a function"""
         return self.run(input_data)
@@ -1,7 +1,10 @@
 # /src/agents/constraint_mining_agent.py
 
+import asyncio
 from typing import List, Optional
 from .base_agent import BaseAgent, AgentInput, AgentOutput
+from ._pool import run_in_pool, run_sync
+from ._cache import cache_agent
 from schemas.index import ParsedSpec
 from schemas.constraint import StaticConstraint, DynamicInvariant, UnifiedConstraint
 from schemas.system_io import HTTPResponse
@@ -34,15 +37,23 @@ class ConstraintMiningAgent(BaseAgent):
         self.combiner = ConstraintCombinerTool()
 
     def run(self, input_data: ConstraintMiningInput) -> ConstraintMiningOutput:
-        # 1. Extract static constraints from the specification
-        static_input = self.static_miner.input_class(parsed_spec=input_data.parsed_spec)
-        static_output = self.static_miner.run(static_input)
+        return run_sync(self.run_async(input_data))
 
-        # 2. Extract dynamic invariants from execution logs (if available)
+    # The orchestrator awaits run_async directly, so that's what is cached
+    @cache_agent
+    async def run_async(
+        self, input_data: ConstraintMiningInput
+    ) -> ConstraintMiningOutput:
+        # 1. Extract static constraints from the specification and
+        # 2. dynamic invariants from execution logs (if available) concurrently
+        static_input = self.static_miner.input_class(parsed_spec=input_data.parsed_spec)
         dynamic_input = self.dynamic_miner.input_class(
             execution_logs=input_data.execution_logs or []
         )
-        dynamic_output = self.dynamic_miner.run(dynamic_input)
+        static_output, dynamic_output = await asyncio.gather(
+            run_in_pool(self.static_miner.run, static_input),
+            run_in_pool(self.dynamic_miner.run, dynamic_input),
+        )
 
         # 3. Combine constraints
         combiner_input = self.combiner.input_class(
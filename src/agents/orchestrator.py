@@ -0,0 +1,101 @@
+# /src/agents/orchestrator.py
+
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+from .base_agent import MAX_PARALLEL
+from ._pool import run_in_pool
+from .spec_analysis_agent import SpecAnalysisAgent
+from .constraint_mining_agent import ConstraintMiningAgent
+from .test_generation_agent import TestGenerationAgent
+from .test_execution_agent import TestExecutionAgent
+from .reporting_agent import ReportingAgent, ReportingOutput
+from schemas.system_io import HTTPResponse
+
+T = TypeVar("T")
+
+
+async def run_pipeline(
+    spec_path: str,
+    target_base_url: str,
+    spec_content: Optional[str] = None,
+    execution_logs: Optional[List[HTTPResponse]] = None,
+    spec_examples: Optional[Dict[str, Any]] = None,
+    save_reports_to: Optional[str] = None,
+    max_parallel: int = MAX_PARALLEL,
+) -> ReportingOutput:
+    """
+    Run the full KAT-RBC pipeline using hybrid execution.
+
+    Phases run sequentially to respect data dependencies, while independent
+    agents inside a phase run concurrently.
+
+    Args:
+        spec_path: Path to the OpenAPI specification
+        target_base_url: Base URL of the API under test
+        spec_content: Optional raw specification content
+        execution_logs: Optional execution logs for dynamic invariant mining
+        spec_examples: Optional examples from the specification
+        save_reports_to: Optional directory to save reports to
+        max_parallel: Maximum number of agent phases in flight at once
+
+    Returns:
+        Output of the reporting agent
+    """
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def _bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    spec_analysis = SpecAnalysisAgent()
+    constraint_mining = ConstraintMiningAgent()
+    test_generation = TestGenerationAgent()
+    test_execution = TestExecutionAgent()
+    reporting = ReportingAgent()
+
+    # Phase 1: Analyze the API specification
+    spec_output = await spec_analysis.run_async(
+        spec_analysis.input_class(spec_path=spec_path, spec_content=spec_content)
+    )
+
+    # Phase 2: Mine constraints while sequences and test data are prepared
+    mining_output, sequences, (valid_files, invalid_files) = await asyncio.gather(
+        _bounded(
+            constraint_mining.run_async(
+                constraint_mining.input_class(
+                    parsed_spec=spec_output.parsed_spec,
+                    execution_logs=execution_logs,
+                )
+            )
+        ),
+        _bounded(run_in_pool(test_generation.prepare_sequences, spec_output.odg)),
+        _bounded(
+            test_generation.generate_data(
+                spec_output.parsed_spec,
+                spec_output.op_schema_deps,
+                spec_output.schema_schema_deps,
+            )
+        ),
+    )
+
+    # Phase 3: Generate test scripts from sequences and constraints
+    generation_output = await test_generation.finish(
+        sequences, mining_output.unified_constraints, valid_files, invalid_files
+    )
+
+    # Phase 4: Execute tests
+    execution_output = await test_execution.run_async(
+        test_execution.input_class(
+            test_scripts=generation_output.test_scripts,
+            spec_examples=spec_examples or {},
+            target_base_url=target_base_url,
+        )
+    )
+
+    # Phase 5: Generate reports and reinforce concurrently
+    return await reporting.run_async(
+        reporting.input_class(
+            test_results=execution_output.results, save_to_path=save_reports_to
+        )
+    )
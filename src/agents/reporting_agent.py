@@ -1,7 +1,11 @@
 # /src/agents/reporting_agent.py
 
+import asyncio
+from pathlib import Path
 from typing import List, Optional, Dict
+import orjson
 from .base_agent import BaseAgent, AgentInput, AgentOutput
+from ._pool import run_in_pool, run_sync
 from schemas.index import TestResults, DashboardArtifact
 from tools.execution import ExperienceReinforcementTool, ReporterTool
 
@@ -27,34 +31,30 @@ class ReportingAgent(BaseAgent):
         self.reporter = ReporterTool()
 
     def run(self, input_data: ReportingInput) -> ReportingOutput:
-        # 1. Generate dashboard reports
-        reporter_input = self.reporter.input_class(results=input_data.test_results)
-        reporter_output = self.reporter.run(reporter_input)
+        return run_sync(self.run_async(input_data))
 
-        # 2. Improve future runs via reinforcement
+    async def run_async(self, input_data: ReportingInput) -> ReportingOutput:
+        # 1. Generate dashboard reports and
+        # 2. improve future runs via reinforcement concurrently
+        reporter_input = self.reporter.input_class(results=input_data.test_results)
         reinforcement_input = self.reinforcement.input_class(
             test_results=input_data.test_results
         )
-        reinforcement_output = self.reinforcement.run(reinforcement_input)
+        reporter_output, reinforcement_output = await asyncio.gather(
+            run_in_pool(self.reporter.run, reporter_input),
+            run_in_pool(self.reinforcement.run, reinforcement_input),
+        )
 
         # 3. Save reports if path specified
         if input_data.save_to_path:
-            # Implementation for saving the dashboard to file
-            pass
+            self._save_dashboard(reporter_output.dashboard, input_data.save_to_path)
 
         # 4. Convert reinforcement output to expected types
         # Convert list of PromptTemplate objects to dictionary by name
-        refined_prompts_dict = (
-            {
-                template.name: {
-                    "template_text": template.template_text,
-                    "version": template.version,
-                }
-                for template in reinforcement_output.update.refined_prompts
-            }
-            if reinforcement_output.update.refined_prompts
-            else {}
-        )
+        refined_prompts_dict = {
+            template.name: template.model_dump(include={"template_text", "version"})
+            for template in reinforcement_output.update.refined_prompts
+        }
 
         # Ensure we have a dictionary for updated weights
         updated_weights_dict = (
@@ -69,3 +69,24 @@ class ReportingAgent(BaseAgent):
             refined_prompts=refined_prompts_dict,
             updated_weights=updated_weights_dict,
         )
+
+    def _save_dashboard(self, dashboard: DashboardArtifact, save_to_path: str) -> Path:
+        """
+        Stream the dashboard to disk as JSON Lines, one section per line.
+
+        Args:
+            dashboard: Dashboard to save
+            save_to_path: Directory to write the dashboard into
+
+        Returns:
+            Path of the written file
+        """
+        output_dir = Path(save_to_path)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        file_path = output_dir / "dashboard.jsonl"
+
+        with open(file_path, "wb") as f:
+            for chunk in dashboard.iter_chunks():
+                f.write(orjson.dumps(chunk, option=orjson.OPT_APPEND_NEWLINE))
+
+        return file_path
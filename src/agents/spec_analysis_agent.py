@@ -2,6 +2,7 @@
 
 from typing import Optional, List
 from .base_agent import BaseAgent, AgentInput, AgentOutput
+from ._cache import cache_agent
 from schemas.index import ParsedSpec
 from schemas.system_io import OASSpecFile
 from schemas.dependency import (
@@ -26,6 +27,17 @@ class SpecAnalysisOutput(AgentOutput):
     schema_schema_deps: List[SchemaSchemaDep]
 
 
+def _spec_file_stamp(input_data: SpecAnalysisInput) -> Optional[List[int]]:
+    """Identify the on-disk spec version so edits invalidate cached analyses."""
+    if input_data.spec_content is not None:
+        return None
+    try:
+        stat = Path(input_data.spec_path).stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
 class SpecAnalysisAgent(BaseAgent):
     """Agent responsible for loading and analyzing the API specification"""
 
@@ -35,6 +47,7 @@ class SpecAnalysisAgent(BaseAgent):
         self.spec_loader = SpecLoaderTool()
         self.odg_constructor = ODGConstructorTool()
 
+    @cache_agent(key_extra=_spec_file_stamp)
     def run(self, input_data: SpecAnalysisInput) -> SpecAnalysisOutput:
         # 1. Load and parse the specification
         spec_loader_input = self.spec_loader.input_class(
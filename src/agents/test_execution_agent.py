@@ -12,6 +12,7 @@ class TestExecutionInput(AgentInput):
     test_scripts: List[GeneratedTestCode]
     spec_examples: Dict[str, Any]
     target_base_url: str
+    max_workers: Optional[int] = None
 
 
 class TestExecutionOutput(AgentOutput):
@@ -28,20 +29,25 @@ class TestExecutionAgent(BaseAgent):
 
     def run(self, input_data: TestExecutionInput) -> TestExecutionOutput:
         # 1. Convert generated test code to verified test code
-        # In a real implementation, this would involve semantic verification
+        # In a real implementation, this would involve semantic verification.
+        # Scripts were already validated upstream, so skip re-validation.
+        verified_at = datetime.datetime.now()
         verified_tests = [
-            VerifiedTestCode(
+            VerifiedTestCode.model_construct(
                 operation_sequence_id=script.operation_sequence_id,
                 language=script.language,
                 content=script.content,
-                verified_at=datetime.datetime.now(),
+                python_equivalent=script.python_equivalent,
+                verified_at=verified_at,
             )
             for script in input_data.test_scripts
         ]
 
-        # 2. Execute the tests
+        # 2. Execute the tests; the executor runs them concurrently
         results = self.test_executor.execute_tests(
-            verified_tests=verified_tests, api_base_url=input_data.target_base_url
+            verified_tests=verified_tests,
+            api_base_url=input_data.target_base_url,
+            max_workers=input_data.max_workers,
         )
 
         # 3. Return the results
@@ -1,7 +1,8 @@
 # /src/agents/test_execution_agent.py
 
-from typing import List
+from typing import List, Tuple
 from .base_agent import BaseAgent, AgentInput, AgentOutput
+from ._pool import run_sync
 from schemas.index import ParsedSpec, Operation
 from schemas.dependency import (
     OperationDependencyGraph as ODGraph,
@@ -41,39 +42,85 @@ class TestGenerationAgent(BaseAgent):
         self.data_generator = TestDataGeneratorTool()
         self.script_generator = TestScriptGeneratorTool()
 
+    # Not cached: generation writes the data and script files its output
+    # points to, which a cache hit would skip
     def run(self, input_data: TestGenerationInput) -> TestGenerationOutput:
+        return run_sync(self.run_async(input_data))
+
+    async def run_async(self, input_data: TestGenerationInput) -> TestGenerationOutput:
         # 1. Generate operation sequences
-        sequences = self.sequencer.run(input_data.odg)
+        sequences = self.prepare_sequences(input_data.odg)
 
         # 2. Generate test data for each operation
-        valid_files = []
-        invalid_files = []
-
-        for operation in input_data.parsed_spec.operations:
-            data_gen_input = self.data_generator.input_class(
-                operation=operation,
-                os_deps=input_data.op_schema_deps,
-                ss_deps=input_data.schema_schema_deps,
-                parsed_spec=input_data.parsed_spec,
-            )
-            data_gen_output = self.data_generator.run(data_gen_input)
-
-            valid_files.append(data_gen_output.valid_file)
-            invalid_files.append(data_gen_output.invalid_file)
-
-        # 3. Generate test scripts
-        all_test_scripts = []
+        valid_files, invalid_files = await self.generate_data(
+            input_data.parsed_spec,
+            input_data.op_schema_deps,
+            input_data.schema_schema_deps,
+        )
+
+        # 3. Generate test scripts and return the results
+        return await self.finish(
+            sequences, input_data.unified_constraints, valid_files, invalid_files
+        )
 
-        for sequence in sequences.operation_sequences:
-            script_gen_input = self.script_generator.input_class(
-                operation_sequence=sequence,
-                constraints=input_data.unified_constraints,
-                data_files=valid_files + invalid_files,
-            )
-            script_gen_output = self.script_generator.run(script_gen_input)
+    def prepare_sequences(self, odg: ODGraph) -> OperationSequenceCollection:
+        """Generate the operation sequences to be turned into test scripts"""
+        return self.sequencer.run(odg)
+
+    async def generate_data(
+        self,
+        parsed_spec: ParsedSpec,
+        op_schema_deps: List[OperationSchemaDep],
+        schema_schema_deps: List[SchemaSchemaDep],
+    ) -> Tuple[List[TestDataFile], List[TestDataFile]]:
+        """Generate valid and invalid test data for every operation concurrently"""
+        # Validation is bypassed because every field comes from already
+        # validated upstream models
+        data_gen_outputs = await self._gather_bounded(
+            self.data_generator.run,
+            [
+                self.data_generator.input_class.model_construct(
+                    operation=operation,
+                    os_deps=op_schema_deps,
+                    ss_deps=schema_schema_deps,
+                    parsed_spec=parsed_spec,
+                )
+                for operation in parsed_spec.operations
+            ],
+        )
+
+        valid_files = [output.valid_file for output in data_gen_outputs]
+        invalid_files = [output.invalid_file for output in data_gen_outputs]
+        return valid_files, invalid_files
+
+    async def finish(
+        self,
+        sequences: OperationSequenceCollection,
+        unified_constraints: List[UnifiedConstraint],
+        valid_files: List[TestDataFile],
+        invalid_files: List[TestDataFile],
+    ) -> TestGenerationOutput:
+        """Generate a test script for every sequence concurrently"""
+        # Shared by every sequence, so built once
+        data_files = valid_files + invalid_files
+        # Validation is bypassed because every field comes from already
+        # validated upstream models
+        script_gen_outputs = await self._gather_bounded(
+            self.script_generator.run,
+            [
+                self.script_generator.input_class.model_construct(
+                    operation_sequence=sequence,
+                    constraints=unified_constraints,
+                    data_files=data_files,
+                )
+                for sequence in sequences.operation_sequences
+            ],
+        )
+
+        all_test_scripts = []
+        for script_gen_output in script_gen_outputs:
             all_test_scripts.extend(script_gen_output.test_scripts)
 
-        # 4. Return the results
         return TestGenerationOutput(
             test_scripts=all_test_scripts,
             valid_data_files=valid_files,
@@ -3,8 +3,11 @@
 """Operation Dependency Graph builder."""
 
 import re
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Dict, List, Set, Tuple
-from schemas.specification import ParsedSpec, Operation
+import orjson
+from schemas.specification import APIResponse, ParsedSpec, Operation
 from schemas.dependency import (
     ODGEdge,
     OperationDependencyGraph,
@@ -12,6 +15,55 @@ from schemas.dependency import (
     SchemaSchemaDep,
 )
 
+_WRITE_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
+_SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+# Structured output requested from the LLM: every inferred edge in one answer
+_LLM_EDGES_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "operation_dependencies",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "edges": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "src": {"type": "string"},
+                            "dst": {"type": "string"},
+                            "reason": {"type": "string"},
+                        },
+                        "required": ["src", "dst", "reason"],
+                    },
+                }
+            },
+            "required": ["edges"],
+        },
+    },
+}
+
+
+@dataclass(slots=True)
+class _OperationColumns:
+    """Operation attributes laid out as parallel lists for repeated scans."""
+
+    ids: List[str]
+    paths: List[str]
+    methods: List[str]
+    responses: List[List[APIResponse]]
+
+    @classmethod
+    def from_operations(cls, operations: List[Operation]) -> "_OperationColumns":
+        return cls(
+            ids=[op.operation_id for op in operations],
+            paths=[op.path for op in operations],
+            methods=[op.method.value for op in operations],
+            responses=[op.responses for op in operations],
+        )
+
 
 class ODGBuilder:
     """
@@ -22,6 +74,9 @@ class ODGBuilder:
     2. LLM-based inference of Operation-Schema and Schema-Schema dependencies
     """
 
+    # Leading path segment, e.g. "flights" in "/flights/{id}"
+    _RESOURCE_RE = re.compile(r"^/+([^/]+)")
+
     def __init__(self, llm_client=None):
         """
         Initialize the ODG Builder with an optional language model client.
@@ -45,16 +100,19 @@ class ODGBuilder:
         Returns:
             Tuple of (operation_dependency_graph, operation_schema_deps, schema_schema_deps)
         """
+        # Read operation attributes once for all analyses
+        columns = _OperationColumns.from_operations(parsed_spec.operations)
+
         # Initialize outputs
-        nodes = [op.operation_id for op in parsed_spec.operations]
+        nodes = list(columns.ids)
         edges = []
 
         # Start with heuristic-based analysis
-        heuristic_edges = self._heuristic_analysis(parsed_spec.operations)
+        heuristic_edges = self._heuristic_analysis(columns)
         edges.extend(heuristic_edges)
 
         # Get operation-schema dependencies
-        os_deps = self._operation_schema_deps(parsed_spec)
+        os_deps = self._operation_schema_deps(columns, parsed_spec)
 
         # Get schema-schema dependencies
         ss_deps = self._schema_schema_deps(parsed_spec)
@@ -69,33 +127,39 @@ class ODGBuilder:
 
         return graph, os_deps, ss_deps
 
-    def _heuristic_analysis(self, operations: List[Operation]) -> List[ODGEdge]:
+    def _heuristic_analysis(self, columns: _OperationColumns) -> List[ODGEdge]:
         """Use heuristics to identify operation dependencies."""
         edges = []
-        op_dict = {op.operation_id: op for op in operations}
 
-        # Build a map of primary resources from path patterns
-        resources = {}
-        for op_id, op in op_dict.items():
+        # Bucket operations by primary resource and method in a single pass
+        resources: Dict[str, Dict[str, List[str]]] = defaultdict(
+            lambda: {"GET": [], "WRITE": [], "POST": []}
+        )
+        resource_re = self._RESOURCE_RE
+        for op_id, path, method in zip(columns.ids, columns.paths, columns.methods):
             # Extract resource from path (e.g., /flights, /bookings)
-            path_parts = op.path.split("/")
-            if len(path_parts) > 1:
-                resource = path_parts[1].rstrip("s")  # singular form
-                if resource:
-                    if resource not in resources:
-                        resources[resource] = []
-                    resources[resource].append(op_id)
+            match = resource_re.match(path)
+            if not match:
+                continue
+            resource = match.group(1).rstrip("s")  # singular form
+            if not resource:
+                continue
+
+            buckets = resources[resource]
+            if method == "GET":
+                buckets["GET"].append(op_id)
+            elif method in _WRITE_METHODS:
+                buckets["WRITE"].append(op_id)
+                if method == "POST":
+                    buckets["POST"].append(op_id)
 
         # Connect GET operations to corresponding POST/PUT/PATCH operations
-        for resource, ops in resources.items():
-            get_ops = [op for op in ops if op_dict[op].method.value == "GET"]
-            write_ops = [
-                op for op in ops if op_dict[op].method.value in ("POST", "PUT", "PATCH")
-            ]
+        for resource, buckets in resources.items():
+            get_ops = buckets["GET"]
 
             # GET -> POST/PUT/PATCH (GET info before making changes)
             for get_op in get_ops:
-                for write_op in write_ops:
+                for write_op in buckets["WRITE"]:
                     edges.append(
                         ODGEdge(
                             src_operation_id=get_op,
@@ -105,8 +169,7 @@ class ODGBuilder:
                     )
 
             # POST -> GET (create then read)
-            post_ops = [op for op in ops if op_dict[op].method.value == "POST"]
-            for post_op in post_ops:
+            for post_op in buckets["POST"]:
                 for get_op in get_ops:
                     edges.append(
                         ODGEdge(
@@ -119,25 +182,25 @@ class ODGBuilder:
         return edges
 
     def _operation_schema_deps(
-        self, parsed_spec: ParsedSpec
+        self, columns: _OperationColumns, parsed_spec: ParsedSpec
     ) -> List[OperationSchemaDep]:
         """Identify dependencies between operations and schemas."""
         os_deps = []
+        components = parsed_spec.components
 
-        for op in parsed_spec.operations:
+        for op_id, responses in zip(columns.ids, columns.responses):
             # Look at each response schema for this operation
-            for resp in op.responses:
-                if resp.schema_ref and resp.schema_ref.startswith(
-                    "#/components/schemas/"
-                ):
-                    schema_name = resp.schema_ref.split("/")[-1]
+            for resp in responses:
+                ref = resp.schema_ref
+                if ref and ref.startswith(_SCHEMA_REF_PREFIX):
+                    schema_name = ref.rsplit("/", 1)[-1]
 
                     # Check if schema exists in components
-                    if schema_name in parsed_spec.components:
+                    if schema_name in components:
                         # Create a simple mapping (empty for now)
                         os_deps.append(
                             OperationSchemaDep(
-                                operation_id=op.operation_id,
+                                operation_id=op_id,
                                 schema_name=schema_name,
                                 param_to_field={},
                             )
@@ -147,32 +210,32 @@ class ODGBuilder:
 
     def _schema_schema_deps(self, parsed_spec: ParsedSpec) -> List[SchemaSchemaDep]:
         """Identify dependencies between schemas."""
-        ss_deps = []
         schemas = parsed_spec.components
+        # dict_keys supports O(1) membership tests without copying
+        schema_names = schemas.keys()
 
-        # Simple heuristic: look for properties with types matching schema names
-        for schema_name, schema in schemas.items():
-            for _, prop in schema.properties.items():
-                # Check if the property type matches a schema name
-                if prop.type in schemas:
-                    ss_deps.append(
-                        SchemaSchemaDep(
-                            parent_schema=schema_name, child_schema=prop.type
-                        )
-                    )
+        def _iter_deps():
+            # Simple heuristic: look for properties with types matching schema names
+            for schema_name, schema in schemas.items():
+                for prop in schema.properties.values():
+                    prop_type = prop.type
 
-                # Look for array types with items referencing schemas
-                if (
-                    prop.type == "array"
-                    and hasattr(prop, "items")
-                    and prop.items in schemas
-                ):
-                    ss_deps.append(
-                        SchemaSchemaDep(
-                            parent_schema=schema_name, child_schema=prop.items
+                    # Check if the property type matches a schema name
+                    if prop_type in schema_names:
+                        yield SchemaSchemaDep(
+                            parent_schema=schema_name, child_schema=prop_type
                         )
-                    )
 
+                    # Look for array types with items referencing schemas;
+                    # the attribute is only probed for arrays
+                    if prop_type == "array":
+                        items = getattr(prop, "items", None)
+                        if items in schema_names:
+                            yield SchemaSchemaDep(
+                                parent_schema=schema_name, child_schema=items
+                            )
+
+        ss_deps = list(_iter_deps())
         return ss_deps
 
     def _llm_analysis(
@@ -181,7 +244,79 @@ class ODGBuilder:
         os_deps: List[OperationSchemaDep],
         ss_deps: List[SchemaSchemaDep],
     ) -> List[ODGEdge]:
-        """Use LLM to identify advanced operation dependencies."""
-        # This would use the LLM to analyze operation interactions
-        # For demonstration, we'll return an empty list
-        return []
+        """
+        Use LLM to identify advanced operation dependencies.
+
+        All operations are described in a single prompt and the model returns
+        every edge in one structured answer, so the cost is one round-trip
+        regardless of the number of operations. The client is expected to
+        expose ``complete(prompt, response_format) -> str`` returning JSON.
+        """
+        operation_ids = {op.operation_id for op in parsed_spec.operations}
+        if len(operation_ids) < 2:
+            return []
+
+        prompt = self._build_llm_prompt(parsed_spec, os_deps, ss_deps)
+        try:
+            raw = self.llm_client.complete(prompt, response_format=_LLM_EDGES_FORMAT)
+            candidates = orjson.loads(raw).get("edges", [])
+        except Exception as e:
+            print(f"Error in LLM dependency analysis: {e}")
+            return []
+
+        # Only keep edges between operations that exist in the spec
+        edges = []
+        for candidate in candidates:
+            if not isinstance(candidate, dict):
+                continue
+            src = candidate.get("src")
+            dst = candidate.get("dst")
+            if src in operation_ids and dst in operation_ids and src != dst:
+                edges.append(
+                    ODGEdge(
+                        src_operation_id=src,
+                        dst_operation_id=dst,
+                        reason=str(candidate.get("reason") or "Inferred by LLM"),
+                    )
+                )
+
+        return edges
+
+    def _build_llm_prompt(
+        self,
+        parsed_spec: ParsedSpec,
+        os_deps: List[OperationSchemaDep],
+        ss_deps: List[SchemaSchemaDep],
+    ) -> str:
+        """Describe all operations and known schema links in a single prompt."""
+        schemas_by_op: Dict[str, List[str]] = defaultdict(list)
+        for dep in os_deps:
+            schemas_by_op[dep.operation_id].append(dep.schema_name)
+
+        lines = [
+            "Identify dependencies between the following REST API operations.",
+            "An edge src -> dst means dst needs data produced by src.",
+            "Answer with JSON of the form "
+            '{"edges": [{"src": "...", "dst": "...", "reason": "..."}]}.',
+            "",
+            "Operations:",
+        ]
+        for op in parsed_spec.operations:
+            params = ", ".join(
+                f"{param.name} ({param.in_.value})" for param in op.parameters
+            )
+            returns = ", ".join(schemas_by_op.get(op.operation_id, [])) or "-"
+            lines.append(
+                f"- {op.operation_id}: {op.method.value} {op.path}"
+                f" | summary: {op.summary or '-'}"
+                f" | params: {params or '-'} | returns: {returns}"
+            )
+
+        if ss_deps:
+            lines.append("")
+            lines.append("Schema relationships:")
+            lines.extend(
+                f"- {dep.parent_schema} contains {dep.child_schema}" for dep in ss_deps
+            )
+
+        return "\n".join(lines)
@@ -2,9 +2,9 @@
 
 """Operation sequencing based on dependency graph."""
 
-import copy
 import uuid
-from typing import Dict, List, Set
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Tuple
 from schemas.dependency import (
     OperationDependencyGraph,
     OperationSequence,
@@ -36,27 +36,29 @@ class OperationSequencer:
         Returns:
             Collection of operation sequences
         """
-        sequence_lists = []
-
-        # Build adjacency list for easier traversal
-        graph = self._build_adjacency_list(odg)
+        # Build adjacency list for easier traversal, counting incoming edges
+        graph, in_degree = self._build_adjacency_list(odg)
 
         # Get nodes with no incoming edges (starting points)
-        start_nodes = self._find_start_nodes(odg)
+        start_nodes = [node for node in odg.nodes if not in_degree.get(node)]
 
         # If no clear starting points, use all nodes
         if not start_nodes:
             start_nodes = odg.nodes
 
-        # Generate sequences starting from each start node
-        for start_node in start_nodes:
-            new_sequences = self._dfs_sequences(graph, start_node, max_sequence_length)
-            sequence_lists.extend(new_sequences)
+        # Encode the graph with integer ids once for the traversal
+        names, offsets, neighbors = self._build_csr(graph)
+        node_ids = {name: i for i, name in enumerate(names)}
 
-            # Limit number of sequences
-            if len(sequence_lists) >= max_sequences:
-                sequence_lists = sequence_lists[:max_sequences]
-                break
+        # Lazily walk from each start node and stop as soon as enough
+        # sequences have been produced
+        candidates = chain.from_iterable(
+            self._dfs_sequences(
+                names, offsets, neighbors, node_ids[start_node], max_sequence_length
+            )
+            for start_node in start_nodes
+        )
+        sequence_lists = list(islice(candidates, max_sequences))
 
         # Convert to OperationSequence objects
         sequences = [
@@ -69,60 +71,94 @@ class OperationSequencer:
 
     def _build_adjacency_list(
         self, odg: OperationDependencyGraph
-    ) -> Dict[str, List[str]]:
-        """Build adjacency list from ODG edges."""
-        graph = {node: [] for node in odg.nodes}
+    ) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+        """Build adjacency list and in-degree map from ODG edges in one pass."""
+        # Dicts act as insertion-ordered sets for O(1) duplicate-edge checks
+        neighbors: Dict[str, Dict[str, None]] = {node: {} for node in odg.nodes}
+        in_degree: Dict[str, int] = {}
 
         for edge in odg.edges:
             src = edge.src_operation_id
             dst = edge.dst_operation_id
-            if src in graph and dst not in graph[src]:
-                graph[src].append(dst)
+            # Every edge marks its destination as non-starting, even when its
+            # source is unknown or the edge is a duplicate
+            in_degree[dst] = in_degree.get(dst, 0) + 1
+            if src in neighbors:
+                neighbors[src][dst] = None
+
+        graph = {node: list(dsts) for node, dsts in neighbors.items()}
+        return graph, in_degree
+
+    def _build_csr(
+        self, graph: Dict[str, List[str]]
+    ) -> Tuple[List[str], List[int], List[int]]:
+        """
+        Encode an adjacency list in compressed sparse row form.
 
-        return graph
+        Args:
+            graph: Adjacency list keyed by operation ID
 
-    def _find_start_nodes(self, odg: OperationDependencyGraph) -> List[str]:
-        """Find nodes with no incoming edges."""
-        # Build set of all destination nodes
-        dest_nodes = set()
-        for edge in odg.edges:
-            dest_nodes.add(edge.dst_operation_id)
+        Returns:
+            Tuple of (names, offsets, neighbors) where the neighbors of node
+            ``i`` are ``neighbors[offsets[i]:offsets[i + 1]]`` and ``names``
+            maps integer ids back to operation IDs
+        """
+        names = list(graph)
+        node_ids = {name: i for i, name in enumerate(names)}
+
+        # Edges may point at operations that are not graph nodes; give them
+        # ids too so they can still end a sequence
+        for dsts in graph.values():
+            for dst in dsts:
+                if dst not in node_ids:
+                    node_ids[dst] = len(names)
+                    names.append(dst)
+
+        offsets = [0]
+        neighbors = []
+        for name in names:
+            neighbors.extend(node_ids[dst] for dst in graph.get(name, ()))
+            offsets.append(len(neighbors))
 
-        # Find nodes that are not destinations
-        start_nodes = [node for node in odg.nodes if node not in dest_nodes]
-        return start_nodes
+        return names, offsets, neighbors
 
     def _dfs_sequences(
         self,
-        graph: Dict[str, List[str]],
-        start: str,
+        names: List[str],
+        offsets: List[int],
+        neighbors: List[int],
+        start: int,
         max_length: int,
-        visited: Set[str] = None,
-        current_path: List[str] = None,
-    ) -> List[List[str]]:
-        """Generate sequences using DFS traversal."""
-        if visited is None:
-            visited = set()
-        if current_path is None:
-            current_path = []
-
-        # Add current node to path
-        current_path.append(start)
-        visited.add(start)
-
-        sequences = []
-
-        # If path is long enough, add it
-        if len(current_path) >= 2:  # Must have at least 2 operations
-            sequences.append(copy.deepcopy(current_path))
-
-        # Continue traversal if path not too long
-        if len(current_path) < max_length:
-            for neighbor in graph.get(start, []):
-                if neighbor not in visited:
-                    new_seqs = self._dfs_sequences(
-                        graph, neighbor, max_length, visited.copy(), current_path.copy()
-                    )
-                    sequences.extend(new_seqs)
-
-        return sequences
+    ) -> Iterator[List[str]]:
+        """Lazily generate sequences using iterative DFS over a CSR graph."""
+        # A single path of node ids is mutated in place; each entry in
+        # ``cursors`` is the position of the next neighbor to try at that depth
+        path = [start]
+        visited = bytearray(len(names))
+        visited[start] = 1
+        cursors = [offsets[start]]
+
+        while cursors:
+            node = path[-1]
+            neighbor = -1
+            if len(path) < max_length:
+                cursor = cursors[-1]
+                end = offsets[node + 1]
+                while cursor < end and visited[neighbors[cursor]]:
+                    cursor += 1
+                if cursor < end:
+                    neighbor = neighbors[cursor]
+                    cursors[-1] = cursor + 1
+
+            if neighbor < 0:
+                # Node exhausted, backtrack
+                cursors.pop()
+                visited[path.pop()] = 0
+                continue
+
+            path.append(neighbor)
+            visited[neighbor] = 1
+            cursors.append(offsets[neighbor])
+
+            # Must have at least 2 operations; decode ids at the boundary
+            yield [names[i] for i in path]
@@ -0,0 +1,189 @@
+# /src/core/execution/_pytest_worker.py
+
+"""Warm pytest worker processes reused across test runs.
+
+Each worker imports pytest once and then serves run requests read as JSON
+lines on stdin. Every request is executed in a child forked from the warm
+worker, so runs skip the interpreter and pytest start-up cost while still
+getting a clean module and plugin state.
+"""
+
+import os
+import sys
+import json
+import math
+import queue
+import signal
+import selectors
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+# Workers rely on fork to hand each run a pristine copy of the warm process
+FORK_AVAILABLE = hasattr(os, "fork")
+
+# Extra time granted to a worker to report a run the child already timed out
+_REPLY_GRACE = 5
+
+
+class PytestWorker:
+    """Client side of a single warm pytest worker process."""
+
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve())],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def run(
+        self, args: List[str], cwd: str, env: Dict[str, str], timeout: float
+    ) -> subprocess.CompletedProcess:
+        """
+        Run pytest with the given arguments in the worker.
+
+        Args:
+            args: Command line arguments for pytest
+            cwd: Working directory of the run
+            env: Environment of the run
+            timeout: Maximum run time in seconds
+
+        Returns:
+            Completed process holding the exit code and the run's stdout
+
+        Raises:
+            subprocess.TimeoutExpired: If the run exceeded the timeout
+            OSError: If the worker died or its pipe broke
+        """
+        output_path = Path(cwd) / ".pytest-output"
+        request = {
+            "args": args,
+            "cwd": cwd,
+            "env": env,
+            "output": str(output_path),
+            "timeout": math.ceil(timeout),
+        }
+        self._proc.stdin.write(json.dumps(request).encode() + b"\n")
+        self._proc.stdin.flush()
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._proc.stdout, selectors.EVENT_READ)
+            if not selector.select(timeout + _REPLY_GRACE):
+                self.close()
+                raise subprocess.TimeoutExpired(args, timeout)
+
+        line = self._proc.stdout.readline()
+        if not line:
+            self.close()
+            raise OSError("pytest worker exited unexpectedly")
+
+        reply = json.loads(line)
+        if reply["timed_out"]:
+            raise subprocess.TimeoutExpired(args, timeout)
+
+        stdout = output_path.read_bytes() if output_path.exists() else b""
+        return subprocess.CompletedProcess(args, reply["rc"], stdout, b"")
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        if self.alive:
+            self._proc.kill()
+        self._proc.wait()
+
+
+class WorkerPool:
+    """Lazily grown pool of warm pytest workers, one per concurrent run."""
+
+    def __init__(self):
+        self._idle: "queue.SimpleQueue[PytestWorker]" = queue.SimpleQueue()
+        self._workers: List[PytestWorker] = []
+        self._lock = threading.Lock()
+
+    def run(
+        self, args: List[str], cwd: str, env: Dict[str, str], timeout: float
+    ) -> subprocess.CompletedProcess:
+        """Run pytest on an idle worker, starting a new one if none is free."""
+        worker = self._acquire()
+        try:
+            return worker.run(args, cwd, env, timeout)
+        finally:
+            if worker.alive:
+                self._idle.put(worker)
+
+    def _acquire(self) -> PytestWorker:
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                worker = PytestWorker()
+                with self._lock:
+                    self._workers.append(worker)
+                return worker
+            if worker.alive:
+                return worker
+
+    def close(self) -> None:
+        """Stop every worker of the pool."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+
+def _run_child(request: Dict) -> int:
+    """Execute one pytest run in a freshly forked child."""
+    # The child enforces its own timeout; SIGALRM terminates it by default
+    signal.alarm(request["timeout"])
+
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+
+    # Keep the protocol pipe clean: send everything the run prints to a file
+    devnull = os.open(os.devnull, os.O_RDWR)
+    output = os.open(request["output"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    os.dup2(devnull, 0)
+    os.dup2(output, 1)
+    os.dup2(devnull, 2)
+
+    try:
+        return int(pytest.main(request["args"]))
+    finally:
+        sys.stdout.flush()
+
+
+def main() -> None:
+    """Serve run requests until stdin is closed."""
+    for line in sys.stdin.buffer:
+        request = json.loads(line)
+        pid = os.fork()
+        if pid == 0:
+            # Never return into the serving loop from the child
+            rc = 1
+            try:
+                rc = _run_child(request)
+            finally:
+                os._exit(rc)
+
+        _, status = os.waitpid(pid, 0)
+        timed_out = os.WIFSIGNALED(status) and os.WTERMSIG(status) == signal.SIGALRM
+        reply = {"rc": os.waitstatus_to_exitcode(status), "timed_out": timed_out}
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    # Run as a script, so drop this package directory from the import path to
+    # keep it from shadowing modules of the tests
+    if sys.path and Path(sys.path[0]).resolve() == Path(__file__).resolve().parent:
+        sys.path.pop(0)
+
+    import pytest
+
+    main()
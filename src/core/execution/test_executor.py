@@ -6,13 +6,22 @@ import os
 import sys
 import time
 import json
+import uuid
+import weakref
 import pytest
+import shutil
 import tempfile
 import subprocess
+import functools
+import orjson
+import contextlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from datetime import datetime, timezone
 
+from ._pytest_worker import FORK_AVAILABLE, WorkerPool
 from schemas.test_data import VerifiedTestCode
 from schemas.test_execution import (
     TestResults,
@@ -20,6 +29,142 @@ from schemas.test_execution import (
     TestStatus,
 )
 
+# pytest configuration shared by all runs; it keeps pytest from picking up
+# configuration files from the directories above the scratch workspace
+_PYTEST_INI_BYTES = b"[pytest]\n"
+
+# pytest plugin loaded from the run directory's conftest.py; it appends one
+# JSON line per test outcome to results.jsonl next to itself and stops tests
+# running past the per-test limit
+_RESULTS_PLUGIN = '''
+import json
+import math
+import os
+import signal
+import time
+from pathlib import Path
+
+import pytest
+
+_RESULTS = Path(__file__).with_name("results.jsonl")
+_TIMEOUT = int(os.environ.get("KAT_RBC_TEST_TIMEOUT") or 0)
+_TIMED_OUT = set()
+
+
+class _TestTimeout(Exception):
+    pass
+
+
+def _expire(signum, frame):
+    raise _TestTimeout(f"timed out after {_TIMEOUT} seconds")
+
+
+def _record(nodeid, outcome, message):
+    # xdist workers forward their reports to the controller, which records them
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+    with open(_RESULTS, "a", encoding="utf-8") as f:
+        f.write(
+            json.dumps({"nodeid": nodeid, "outcome": outcome, "message": message})
+            + "\\n"
+        )
+
+
+def _message(report):
+    if isinstance(report.longrepr, tuple):
+        reason = report.longrepr[2]
+        return reason[len("Skipped: "):] if reason.startswith("Skipped: ") else reason
+    crash = getattr(report.longrepr, "reprcrash", None)
+    return crash.message if crash is not None else str(report.longrepr)
+
+
+def pytest_collectreport(report):
+    if not report.nodeid:
+        return
+    if report.failed:
+        _record(report.nodeid, "error", "collection failure")
+    elif report.skipped:
+        _record(report.nodeid, "skipped", "collection skipped")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    if not _TIMEOUT or not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    # A warm worker's alarm for the whole run also uses SIGALRM; it is put
+    # back afterwards, and left alone when it would go off first anyway
+    pending = signal.alarm(0)
+    if pending and pending <= _TIMEOUT:
+        signal.alarm(pending)
+        yield
+        return
+
+    started = time.monotonic()
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.alarm(_TIMEOUT)
+    try:
+        outcome = yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+        if pending:
+            elapsed = time.monotonic() - started
+            signal.alarm(max(1, math.ceil(pending - elapsed)))
+
+    excinfo = outcome.excinfo
+    if excinfo is not None and issubclass(excinfo[0], _TestTimeout):
+        _TIMED_OUT.add(item.nodeid)
+
+
+def pytest_runtest_logreport(report):
+    if report.nodeid in _TIMED_OUT and report.when == "call":
+        _record(report.nodeid, "error", f"timed out after {_TIMEOUT} seconds")
+    elif hasattr(report, "wasxfail"):
+        if report.when == "call":
+            _record(report.nodeid, "skipped", report.wasxfail)
+    elif report.when == "call":
+        message = "" if report.passed else _message(report)
+        _record(report.nodeid, report.outcome, message)
+    elif report.failed:
+        _record(
+            report.nodeid,
+            "error",
+            f'failed on {report.when} with "{_message(report)}"',
+        )
+    elif report.skipped:
+        _record(report.nodeid, "skipped", _message(report))
+'''
+
+# Passes the per-test time limit to the results plugin of a run
+TEST_TIMEOUT_ENV = "KAT_RBC_TEST_TIMEOUT"
+
+# pytest-xdist is optional; without it batches are split over concurrent runs
+_XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _groovy_executable() -> Optional[str]:
+    """
+    Locate a working Groovy installation, probing it only once per process.
+
+    Returns:
+        Resolved path of the groovy executable, or None if it is unavailable
+    """
+    groovy = shutil.which("groovy")
+    if groovy is None:
+        return None
+
+    try:
+        proc = subprocess.run(
+            [groovy, "--version"], capture_output=True, check=False, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    return groovy if proc.returncode == 0 else None
+
 
 class TestExecutor:
     """
@@ -29,7 +174,14 @@ class TestExecutor:
     mismatched, or unknown.
     """
 
-    def __init__(self, timeout: int = 60, parallel: bool = True, max_retries: int = 2):
+    def __init__(
+        self,
+        timeout: int = 60,
+        parallel: bool = True,
+        max_retries: int = 2,
+        max_workers: Optional[int] = None,
+        parallel_workers: Optional[int] = None,
+    ):
         """
         Initialize the test executor.
 
@@ -37,13 +189,60 @@ class TestExecutor:
             timeout: Maximum execution time per test in seconds
             parallel: Whether to run tests in parallel
             max_retries: Maximum number of retries for failed tests
+            max_workers: Maximum number of tests run at once when parallel,
+                defaults to the number of CPU cores
+            parallel_workers: Number of concurrent pytest workers for a Python
+                batch, xdist workers when xdist is installed and separate
+                pytest runs otherwise, defaults to max_workers
         """
         self.timeout = timeout
         self.parallel = parallel
         self.max_retries = max_retries
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_workers = parallel_workers or self.max_workers
+
+        # Scratch workspace reused by every run of this executor
+        self._scratch = Path(tempfile.mkdtemp(prefix="kat-rbc-"))
+        # Removed by close(), once the executor is garbage collected, or at
+        # exit, whichever comes first
+        self._remove_scratch = weakref.finalize(
+            self, shutil.rmtree, self._scratch, ignore_errors=True
+        )
+
+        # Shared pytest configuration, written once for every run
+        self._pytest_ini = self._scratch / "pytest.ini"
+        self._pytest_ini.write_bytes(_PYTEST_INI_BYTES)
+
+        # Warm pytest workers, started on first use, where fork is supported
+        self._workers = WorkerPool() if FORK_AVAILABLE else None
+        self._close_workers = (
+            weakref.finalize(self, self._workers.close)
+            if self._workers is not None
+            else None
+        )
+
+    def close(self) -> None:
+        """Stop the pytest workers and release the scratch workspace."""
+        if self._close_workers is not None:
+            self._close_workers()
+            self._workers = None
+        self._remove_scratch()
+
+    @contextlib.contextmanager
+    def _run_dir(self) -> Iterator[Path]:
+        """Provide a fresh directory inside the scratch workspace for one run."""
+        run_path = self._scratch / f"t-{uuid.uuid4().hex}"
+        run_path.mkdir()
+        try:
+            yield run_path
+        finally:
+            shutil.rmtree(run_path, ignore_errors=True)
 
     def execute_tests(
-        self, verified_tests: List[VerifiedTestCode], api_base_url: str
+        self,
+        verified_tests: List[VerifiedTestCode],
+        api_base_url: str,
+        max_workers: Optional[int] = None,
     ) -> TestResults:
         """
         Execute verified tests against a live API.
@@ -51,142 +250,343 @@ class TestExecutor:
         Args:
             verified_tests: List of verified test code to execute
             api_base_url: Base URL of the target API
+            max_workers: Optional override of the executor's worker count
 
         Returns:
             Test execution results
         """
-        outcomes = []
-        suite_id = f"suite-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-
-        # Set environment variables for tests
-        os.environ["API_BASE_URL"] = api_base_url
-
-        # Execute tests based on language
-        for test in verified_tests:
+        # Random ids stay unique for suites started within the same second
+        suite_id = f"suite-{uuid.uuid4().hex[:12]}"
+
+        # Pass the target to each test process instead of mutating os.environ,
+        # which is shared by concurrently running tests
+        env = {**os.environ, "API_BASE_URL": api_base_url}
+
+        # Python tests share a single pytest run; other tests run one by one
+        # unless they come with a Python translation, which avoids starting
+        # their language runtime
+        python_indices = []
+        python_tests = []
+        other_indices = []
+        for i, test in enumerate(verified_tests):
             if test.language.lower() == "python":
-                test_outcomes = self._execute_python_test(test)
-            elif test.language.lower() == "groovy":
-                test_outcomes = self._execute_groovy_test(test)
+                python_indices.append(i)
+                python_tests.append(test)
+            elif test.python_equivalent:
+                python_indices.append(i)
+                python_tests.append(
+                    test.model_copy(
+                        update={"language": "python", "content": test.python_equivalent}
+                    )
+                )
             else:
-                print(f"Unsupported language: {test.language}")
-                continue
+                other_indices.append(i)
+
+        workers = (max_workers or self.max_workers) if self.parallel else 1
+        workers = max(1, min(workers, len(other_indices) + 1))
+
+        # Each run happens in its own subprocess, so threads are enough to
+        # overlap them
+        outcomes_by_index: Dict[int, List[TestOutcome]] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            python_future = (
+                executor.submit(self._execute_python_tests_batched, python_tests, env)
+                if python_tests
+                else None
+            )
+            other_futures = {
+                i: executor.submit(self._dispatch_test, verified_tests[i], env)
+                for i in other_indices
+            }
+
+            if python_future is not None:
+                outcomes_by_index.update(zip(python_indices, python_future.result()))
+            for i, future in other_futures.items():
+                outcomes_by_index[i] = future.result()
 
-            outcomes.extend(test_outcomes)
+        # Report outcomes in test order
+        outcomes = [
+            outcome
+            for i in range(len(verified_tests))
+            for outcome in outcomes_by_index[i]
+        ]
 
         return TestResults(
-            suite_id=suite_id, outcomes=outcomes, executed_at=datetime.utcnow()
+            suite_id=suite_id, outcomes=outcomes, executed_at=datetime.now(timezone.utc)
         )
 
-    def _execute_python_test(self, test: VerifiedTestCode) -> List[TestOutcome]:
+    def _dispatch_test(
+        self, test: VerifiedTestCode, env: Dict[str, str]
+    ) -> List[TestOutcome]:
         """
-        Execute a Python test script.
+        Execute a test with the runner for its language.
 
         Args:
-            test: Verified Python test code
+            test: Verified test code
+            env: Environment for the test process
 
         Returns:
-            List of test outcomes
+            List of test outcomes, empty for unsupported languages
         """
-        outcomes = []
+        language = test.language.lower()
+        if language == "python":
+            return self._execute_python_tests_batched([test], env)[0]
+        if language == "groovy":
+            return self._execute_groovy_test(test, env)
+
+        print(f"Unsupported language: {test.language}")
+        return []
+
+    def _execute_python_tests_batched(
+        self, tests: List[VerifiedTestCode], env: Dict[str, str]
+    ) -> List[List[TestOutcome]]:
+        """
+        Execute several Python test scripts with as few pytest runs as possible.
 
-        # Create a temporary directory for test execution
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        With pytest-xdist the whole batch is one run spread over its workers;
+        without it the scripts are split round-robin over concurrent runs.
 
-            # Create test module file
-            test_file = temp_path / "test_execution.py"
-            with open(test_file, "w") as f:
-                f.write(test.content)
+        Args:
+            tests: Verified Python test code
+            env: Environment for the test process
 
-            # Create a pytest.ini file with test result collection
-            pytest_ini = temp_path / "pytest.ini"
-            with open(pytest_ini, "w") as f:
-                f.write(
-                    """
-[pytest]
-junit_family=xunit2
-addopts=--junitxml=results.xml
-"""
+        Returns:
+            One list of test outcomes per test, in the same order as ``tests``
+        """
+        workers = min(self.parallel_workers, len(tests)) if self.parallel else 1
+        if _XDIST_AVAILABLE or workers <= 1:
+            return self._run_python_batch(tests, env, workers)
+
+        # The runs wait on their subprocess, so threads are enough to overlap
+        # them
+        chunks = [range(k, len(tests), workers) for k in range(workers)]
+        outcomes_per_test: List[List[TestOutcome]] = [[] for _ in tests]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._run_python_batch, [tests[i] for i in chunk], env, 1
                 )
+                for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, futures):
+                for i, outcomes in zip(chunk, future.result()):
+                    outcomes_per_test[i] = outcomes
+
+        return outcomes_per_test
 
-            # Run pytest as a subprocess to isolate execution
-            cmd = [
-                sys.executable,
-                "-m",
-                "pytest",
-                str(test_file),
+    def _run_python_batch(
+        self, tests: List[VerifiedTestCode], env: Dict[str, str], workers: int
+    ) -> List[List[TestOutcome]]:
+        """
+        Execute several Python test scripts with a single pytest invocation.
+
+        Each script is written to its own module so pytest starts only once for
+        the whole batch; outcomes are mapped back to their script by module.
+
+        Args:
+            tests: Verified Python test code
+            env: Environment for the test process
+            workers: Number of pytest-xdist workers to use when available
+
+        Returns:
+            One list of test outcomes per test, in the same order as ``tests``
+        """
+        outcomes_per_test: List[List[TestOutcome]] = [[] for _ in tests]
+
+        # Create a run directory in the scratch workspace for test execution
+        with self._run_dir() as temp_path:
+            temp_dir = str(temp_path)
+
+            # Create one test module file per script
+            module_index = {}
+            for i, test in enumerate(tests):
+                module_name = f"test_{i}"
+                module_index[module_name] = i
+                with open(temp_path / f"{module_name}.py", "w") as f:
+                    f.write(test.content)
+
+            # Create a conftest.py plugin collecting results
+            with open(temp_path / "conftest.py", "w") as f:
+                f.write(_RESULTS_PLUGIN)
+
+            # Run pytest once as a subprocess to isolate execution; a broken
+            # module must not stop the others from running
+            args = [
+                temp_dir,
+                "-c",
+                str(self._pytest_ini),
+                "--rootdir",
+                temp_dir,
                 "-v",
-                "--junitxml=results.xml",
+                "-p",
+                "no:cacheprovider",
+                "--no-header",
+                "--continue-on-collection-errors",
             ]
 
+            # Distribute modules over xdist workers when available; loadfile
+            # keeps each script's tests together on one worker
+            if _XDIST_AVAILABLE and workers > 1:
+                args.extend(["-n", str(workers), "--dist=loadfile"])
+
+            # The plugin limits every test; the run as a whole gets the sum
+            # of the limits in case a test cannot be interrupted
+            env = {**env, TEST_TIMEOUT_ENV: str(self.timeout)}
+            timeout = self.timeout * len(tests)
+            results_path = temp_path / "results.jsonl"
+
             try:
                 # Execute the tests
-                proc = subprocess.run(
-                    cmd,
-                    cwd=temp_dir,
-                    capture_output=True,
-                    timeout=self.timeout,
-                    check=False,
-                    env=dict(os.environ),
-                )
+                proc = self._run_pytest(args, temp_dir, env, timeout)
 
                 # Parse test outcomes from output
-                xml_path = temp_path / "results.xml"
-                if xml_path.exists():
-                    outcomes = self._parse_pytest_results(xml_path)
+                if results_path.exists():
+                    outcomes_per_test = self._map_batch_results(
+                        results_path, tests, module_index
+                    )
                 else:
-                    # If no XML was created, create a generic outcome
-                    outcomes = [
-                        TestOutcome(
-                            test_name=f"{test.operation_sequence_id}",
-                            status=(
-                                TestStatus.UNKNOWN
-                                if proc.returncode != 0
-                                else TestStatus.MATCHED
-                            ),
-                            details=f"Exit code: {proc.returncode}, Output: {proc.stdout.decode()[:200]}...",
-                        )
-                    ]
+                    # If no results were recorded, create a generic outcome;
+                    # only the logged head of the output is decoded
+                    output = proc.stdout[:200].decode(errors="replace")
+                    for i, test in enumerate(tests):
+                        outcomes_per_test[i] = [
+                            TestOutcome(
+                                test_name=f"{test.operation_sequence_id}",
+                                status=(
+                                    TestStatus.UNKNOWN
+                                    if proc.returncode != 0
+                                    else TestStatus.MATCHED
+                                ),
+                                details=f"Exit code: {proc.returncode}, Output: {output}...",
+                            )
+                        ]
 
             except subprocess.TimeoutExpired:
-                outcomes = [
-                    TestOutcome(
-                        test_name=f"{test.operation_sequence_id}",
-                        status=TestStatus.UNKNOWN,
-                        details=f"Test execution timed out after {self.timeout} seconds",
+                # Keep what finished before the run was stopped; only scripts
+                # without any record are reported as timed out
+                if results_path.exists():
+                    outcomes_per_test = self._map_batch_results(
+                        results_path, tests, module_index
                     )
-                ]
+                for i, test in enumerate(tests):
+                    if not outcomes_per_test[i]:
+                        outcomes_per_test[i] = [
+                            TestOutcome(
+                                test_name=f"{test.operation_sequence_id}",
+                                status=TestStatus.UNKNOWN,
+                                details=f"Test execution timed out after {timeout} seconds",
+                            )
+                        ]
             except Exception as e:
-                outcomes = [
-                    TestOutcome(
-                        test_name=f"{test.operation_sequence_id}",
-                        status=TestStatus.UNKNOWN,
-                        details=f"Error during test execution: {str(e)}",
-                    )
+                outcomes_per_test = [
+                    [
+                        TestOutcome(
+                            test_name=f"{test.operation_sequence_id}",
+                            status=TestStatus.UNKNOWN,
+                            details=f"Error during test execution: {str(e)}",
+                        )
+                    ]
+                    for test in tests
                 ]
 
-        return outcomes
+        return outcomes_per_test
+
+    def _map_batch_results(
+        self,
+        results_path: Path,
+        tests: List[VerifiedTestCode],
+        module_index: Dict[str, int],
+    ) -> List[List[TestOutcome]]:
+        """
+        Map the outcomes recorded for a batch back to the scripts they came from.
 
-    def _execute_groovy_test(self, test: VerifiedTestCode) -> List[TestOutcome]:
+        Args:
+            results_path: Path to the batch's results.jsonl file
+            tests: Verified Python test code of the batch
+            module_index: Position in ``tests`` of each script's module name
+
+        Returns:
+            One list of test outcomes per test, in the same order as ``tests``
+        """
+        outcomes_per_test: List[List[TestOutcome]] = [[] for _ in tests]
+        batch_outcomes = []
+        for outcome in self._parse_results(results_path):
+            # Modules were named per script; report names as if each script
+            # had run on its own
+            module, sep, rest = outcome.test_name.partition(".")
+            index = module_index.get(module)
+            if index is None:
+                # Not from a script, e.g. a failing conftest.py; it concerns
+                # the whole batch
+                batch_outcomes.append(outcome)
+                continue
+            # Module level records, e.g. collection failures, are named after
+            # the script's sequence
+            outcome.test_name = (
+                f"test_execution{sep}{rest}"
+                if sep
+                else f"{tests[index].operation_sequence_id}"
+            )
+            outcomes_per_test[index].append(outcome)
+
+        # Every script of the batch is affected, with an unknown outcome under
+        # the record's own name
+        for outcome in batch_outcomes:
+            for test_outcomes in outcomes_per_test:
+                test_outcomes.append(
+                    outcome.model_copy(update={"status": TestStatus.UNKNOWN})
+                )
+
+        return outcomes_per_test
+
+    def _run_pytest(
+        self, args: List[str], cwd: str, env: Dict[str, str], timeout: float
+    ) -> subprocess.CompletedProcess:
+        """
+        Run pytest on a warm worker, or in a fresh subprocess as a fallback.
+
+        Args:
+            args: Command line arguments for pytest
+            cwd: Working directory of the run
+            env: Environment for the test process
+            timeout: Maximum run time in seconds
+
+        Returns:
+            Completed process with the exit code and captured stdout
+        """
+        if self._workers is not None:
+            try:
+                return self._workers.run(args, cwd, env, timeout)
+            except subprocess.TimeoutExpired:
+                raise
+            except OSError as e:
+                print(f"Error in pytest worker, falling back to subprocess: {e}")
+
+        return subprocess.run(
+            [sys.executable, "-m", "pytest", *args],
+            cwd=cwd,
+            capture_output=True,
+            timeout=timeout,
+            check=False,
+            env=env,
+        )
+
+    def _execute_groovy_test(
+        self, test: VerifiedTestCode, env: Dict[str, str]
+    ) -> List[TestOutcome]:
         """
         Execute a Groovy test script.
 
         Args:
             test: Verified Groovy test code
+            env: Environment for the test process
 
         Returns:
             List of test outcomes
         """
         # Check if Groovy is installed
-        try:
-            proc = subprocess.run(
-                ["groovy", "--version"], capture_output=True, check=False, timeout=5
-            )
-            groovy_installed = proc.returncode == 0
-        except:
-            groovy_installed = False
-
-        if not groovy_installed:
+        groovy = _groovy_executable()
+        if groovy is None:
             return [
                 TestOutcome(
                     test_name=f"{test.operation_sequence_id}",
@@ -195,20 +595,22 @@ addopts=--junitxml=results.xml
                 )
             ]
 
-        # Create a temporary directory for test execution
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Create a run directory in the scratch workspace for test execution
+        with self._run_dir() as temp_path:
+            temp_dir = str(temp_path)
 
             # Create test script file
             test_file = temp_path / "test_execution.groovy"
             with open(test_file, "w") as f:
                 f.write(test.content)
 
-            # Create a basic JUnit XML output generator
+            # Create a results collector writing one JSON line per test
             result_collector = temp_path / "collect_results.groovy"
             with open(result_collector, "w") as f:
                 f.write(
                     """
+import groovy.json.JsonOutput
+
 // Simple results collector
 def testResults = [:]
 
@@ -218,45 +620,33 @@ this.metaClass.static.assert = { boolean condition, String message = "" ->
     try {
         oldAssert(condition, message)
         testResults[Thread.currentThread().stackTrace[2].methodName] = [
-            status: "PASSED",
-            message: "Test passed"
+            outcome: "passed",
+            message: ""
         ]
     } catch (AssertionError e) {
         testResults[Thread.currentThread().stackTrace[2].methodName] = [
-            status: "FAILED", 
+            outcome: "failed",
             message: message ?: e.message
         ]
         throw e
     }
 }
 
+def writeResults = { List records ->
+    new File("results.jsonl").withWriter("UTF-8") { writer ->
+        records.each { writer << JsonOutput.toJson(it) << "\\n" }
+    }
+}
+
 // Run script and collect results
 try {
     evaluate(new File("test_execution.groovy"))
-    
-    // Write results to JUnit-style XML
-    def writer = new StringWriter()
-    def xml = new groovy.xml.MarkupBuilder(writer)
-    xml.testsuite(name: "groovy-tests", tests: testResults.size(), failures: testResults.count { it.value.status == "FAILED" }, time: "0") {
-        testResults.each { testName, result ->
-            testcase(name: testName, classname: "GroovyTest", time: "0") {
-                if (result.status == "FAILED") {
-                    failure(message: result.message, type: "AssertionError")
-                }
-            }
-        }
-    }
-    
-    new File("results.xml").text = writer.toString()
+    writeResults(testResults.collect { testName, result ->
+        [nodeid: "GroovyTest::" + testName, outcome: result.outcome, message: result.message]
+    })
 } catch (Exception e) {
     println "Error executing test: ${e.message}"
-    # Fix: Use triple single quotes for Python string containing triple-quoted Groovy string
-    new File("results.xml").text = '''<?xml version="1.0" encoding="UTF-8"?>
-<testsuite name="groovy-tests" tests="1" failures="1">
-  <testcase name="execution" classname="GroovyTest">
-    <failure message="${e.message}" type="${e.class.name}"/>
-  </testcase>
-</testsuite>'''
+    writeResults([[nodeid: "GroovyTest::execution", outcome: "failed", message: e.message]])
 }
 """
                 )
@@ -264,21 +654,22 @@ try {
             # Run the test
             try:
                 # Execute the test collector (which runs the test)
-                cmd = ["groovy", str(result_collector)]
+                cmd = [groovy, str(result_collector)]
                 proc = subprocess.run(
                     cmd,
                     cwd=temp_dir,
                     capture_output=True,
                     timeout=self.timeout,
                     check=False,
+                    env=env,
                 )
 
                 # Parse test outcomes from output
-                xml_path = temp_path / "results.xml"
-                if xml_path.exists():
-                    outcomes = self._parse_groovy_results(xml_path)
+                results_path = temp_path / "results.jsonl"
+                if results_path.exists():
+                    outcomes = self._parse_results(results_path)
                 else:
-                    # If no XML was created, create a generic outcome
+                    # If no results were recorded, create a generic outcome
                     outcomes = [
                         TestOutcome(
                             test_name=f"{test.operation_sequence_id}",
@@ -287,7 +678,7 @@ try {
                                 if proc.returncode != 0
                                 else TestStatus.MATCHED
                             ),
-                            details=f"Exit code: {proc.returncode}, Output: {proc.stdout.decode()[:200]}...",
+                            details=f"Exit code: {proc.returncode}, Output: {proc.stdout[:200].decode(errors='replace')}...",
                         )
                     ]
 
@@ -310,144 +701,61 @@ try {
 
         return outcomes
 
-    def _parse_pytest_results(self, xml_path: Path) -> List[TestOutcome]:
+    def _parse_results(self, results_path: Path) -> List[TestOutcome]:
         """
-        Parse pytest XML results into test outcomes.
+        Parse the JSON lines written by the result plugins into test outcomes.
+
+        Each line holds a ``nodeid``, an ``outcome`` (passed, failed, error or
+        skipped) and a ``message``. A test reported more than once, e.g. a
+        passing call followed by a teardown error, keeps its first non-passing
+        record.
 
         Args:
-            xml_path: Path to pytest XML results file
+            results_path: Path to the results.jsonl file
 
         Returns:
             List of test outcomes
         """
-        import xml.etree.ElementTree as ET
-
-        outcomes = []
+        records: Dict[str, Dict[str, Any]] = {}
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-
-            for testcase in root.findall(".//testcase"):
-                name = testcase.get("name", "unknown")
-                classname = testcase.get("classname", "")
-                test_name = f"{classname}.{name}" if classname else name
-
-                # Check for failures or errors
-                failure = testcase.find("failure")
-                error = testcase.find("error")
-                skipped = testcase.find("skipped")
-
-                if failure is not None:
-                    message = failure.get("message", "")
-                    outcomes.append(
-                        TestOutcome(
-                            test_name=test_name,
-                            status=TestStatus.MISMATCHED,
-                            expected=failure.get("expected", ""),
-                            actual=failure.get("actual", ""),
-                            details=message,
-                        )
-                    )
-                elif error is not None:
-                    message = error.get("message", "")
-                    outcomes.append(
-                        TestOutcome(
-                            test_name=test_name,
-                            status=TestStatus.UNKNOWN,
-                            details=message,
-                        )
-                    )
-                elif skipped is not None:
-                    message = skipped.get("message", "")
-                    outcomes.append(
-                        TestOutcome(
-                            test_name=test_name,
-                            status=TestStatus.UNKNOWN,
-                            details=f"Test skipped: {message}",
-                        )
-                    )
-                else:
-                    # Test passed
-                    outcomes.append(
-                        TestOutcome(
-                            test_name=test_name,
-                            status=TestStatus.MATCHED,
-                            details="Test passed",
-                        )
-                    )
+            with open(results_path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = orjson.loads(line)
+                    previous = records.get(record["nodeid"])
+                    if previous is None or previous["outcome"] == "passed":
+                        records[record["nodeid"]] = record
         except Exception as e:
             # If parsing fails, create a generic outcome
-            outcomes.append(
+            return [
                 TestOutcome(
-                    test_name="xml_parsing",
+                    test_name="results_parsing",
                     status=TestStatus.UNKNOWN,
                     details=f"Error parsing test results: {str(e)}",
                 )
-            )
-
-        return outcomes
-
-    def _parse_groovy_results(self, xml_path: Path) -> List[TestOutcome]:
-        """
-        Parse Groovy/JUnit XML results into test outcomes.
-
-        Args:
-            xml_path: Path to JUnit XML results file
-
-        Returns:
-            List of test outcomes
-        """
-        import xml.etree.ElementTree as ET
+            ]
 
         outcomes = []
-        try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-
-            for testcase in root.findall(".//testcase"):
-                name = testcase.get("name", "unknown")
-                classname = testcase.get("classname", "")
-                test_name = f"{classname}.{name}" if classname else name
-
-                # Check for failures or errors
-                failure = testcase.find("failure")
-                error = testcase.find("error")
+        for nodeid, record in records.items():
+            # "test_0.py::TestC::test_m" is reported as "test_0.TestC.test_m"
+            module, sep, rest = nodeid.partition("::")
+            module = module.removesuffix(".py")
+            test_name = f"{module}.{rest.replace('::', '.')}" if sep else module
+
+            outcome = record["outcome"]
+            message = record.get("message") or ""
+            if outcome == "passed":
+                status, details = TestStatus.MATCHED, "Test passed"
+            elif outcome == "failed":
+                status, details = TestStatus.MISMATCHED, message
+            elif outcome == "skipped":
+                status, details = TestStatus.UNKNOWN, f"Test skipped: {message}"
+            else:
+                status, details = TestStatus.UNKNOWN, message
 
-                if failure is not None:
-                    message = failure.get("message", "")
-                    outcomes.append(
-                        TestOutcome(
-                            test_name=test_name,
-                            status=TestStatus.MISMATCHED,
-                            details=message,
-                        )
-                    )
-                elif error is not None:
-                    message = error.get("message", "")
-                    outcomes.append(
-                        TestOutcome(
-                            test_name=test_name,
-                            status=TestStatus.UNKNOWN,
-                            details=message,
-                        )
-                    )
-                else:
-                    # Test passed
-                    outcomes.append(
-                        TestOutcome(
-                            test_name=test_name,
-                            status=TestStatus.MATCHED,
-                            details="Test passed",
-                        )
-                    )
-        except Exception as e:
-            # If parsing fails, create a generic outcome
             outcomes.append(
-                TestOutcome(
-                    test_name="xml_parsing",
-                    status=TestStatus.UNKNOWN,
-                    details=f"Error parsing test results: {str(e)}",
-                )
+                TestOutcome(test_name=test_name, status=status, details=details)
             )
 
         return outcomes
@@ -2,15 +2,104 @@
 
 """Test data generation for API operations."""
 
-import json
 import os
 import uuid
+import orjson
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
-from schemas.specification import ParsedSpec, Operation
+from string import Template
+from typing import Callable, Dict, List, Any, Tuple
+from schemas.common import HTTPMethod
+from schemas.specification import ParsedSpec, Operation, ParameterLocation
 from schemas.dependency import OperationSchemaDep, SchemaSchemaDep
 from schemas.test_data import TestDataItem, DataSetKind, TestDataFile, GeneratedTestCode
 
+# Validation script emitted for the test data files of each operation
+_VALIDATION_SCRIPT_TEMPLATE = Template("""
+# Generated validation script for $operation_id
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+# Data files are written compactly, so a line starting with this prefix holds
+# a non-empty object payload, which always passes the valid-item check
+NON_EMPTY_DATA_PREFIX = b'{"data":{"'
+
+def validate_request(data, expected_valid):
+    \"\"\"
+    Validate if request data meets the expected constraints.
+
+    Args:
+        data: Request payload to validate
+        expected_valid: Whether this data should be valid or not
+
+    Returns:
+        Tuple of (is_valid, message)
+    \"\"\"
+    # Basic validation rules for $operation_id
+    if expected_valid:
+        if not data:
+            return False, "Valid request cannot be empty"
+    else:
+        # For cases expected to be invalid, we still validate
+        # the structure to ensure they're invalid for the right reason
+        pass
+
+    return True, "Validation successful"
+
+def main():
+    # Load and validate test data files
+    valid_file = "${operation_id}_valid.jsonl"
+    invalid_file = "${operation_id}_invalid.jsonl"
+    
+    # Validate valid items, decoding only lines the prefix cannot settle
+    with open(valid_file, 'rb', buffering=1024 * 1024) as f:
+        for line in f:
+            if line.startswith(NON_EMPTY_DATA_PREFIX):
+                continue
+            current_item = json.loads(line)
+            is_valid, message = validate_request(current_item['data'], True)
+            if not is_valid:
+                print(f"ERROR: Valid item failed validation: {message}")
+                print(f"Item: {current_item}")
+    
+    # Validate invalid items
+    with open(invalid_file, 'rb', buffering=1024 * 1024) as f:
+        for line in f:
+            current_item = json.loads(line)
+            is_valid, message = validate_request(current_item['data'], False)
+            if not is_valid:
+                print(f"ERROR: Invalid item validation issue: {message}")
+                print(f"Item: {current_item}")
+
+if __name__ == "__main__":
+    main()
+""")
+
+# Structured output requested from the LLM: both data sets in one answer
+_LLM_DATA_ITEMS = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "data": {"type": "object"},
+            "expected_code": {"type": "integer"},
+        },
+        "required": ["data", "expected_code"],
+    },
+}
+_LLM_DATA_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "operation_test_data",
+        "schema": {
+            "type": "object",
+            "properties": {"valid": _LLM_DATA_ITEMS, "invalid": _LLM_DATA_ITEMS},
+            "required": ["valid", "invalid"],
+        },
+    },
+}
+
 
 class TestDataGenerator:
     """
@@ -20,6 +109,21 @@ class TestDataGenerator:
     and schema dependencies.
     """
 
+    # Template value generators by parameter type
+    _PARAM_TEMPLATES: Dict[str, Callable[[str], Any]] = {
+        "string": lambda name: f"test_{name}",
+        "integer": lambda _: 42,
+        "boolean": lambda _: True,
+    }
+
+    # Expected status code of a valid template request by method
+    _METHOD_EXPECTED: Dict[HTTPMethod, int] = {
+        HTTPMethod.GET: 200,
+        HTTPMethod.POST: 201,
+        HTTPMethod.PUT: 201,
+        HTTPMethod.PATCH: 201,
+    }
+
     def __init__(self, llm_client=None, output_dir: str = "test_data"):
         """
         Initialize the test data generator.
@@ -51,16 +155,20 @@ class TestDataGenerator:
         Returns:
             Tuple of (valid_data_file, invalid_data_file, validation_script)
         """
-        # Get valid cases first
-        valid_items = self._generate_valid_data(
+        # Get valid and invalid cases together
+        valid_items, invalid_items = self._generate_data(
             operation, os_deps, ss_deps, parsed_spec
         )
 
-        # Then invalid cases
-        invalid_items = self._generate_invalid_data(
-            operation, os_deps, ss_deps, parsed_spec
-        )
+        return self._write_test_data(operation, valid_items, invalid_items)
 
+    def _write_test_data(
+        self,
+        operation: Operation,
+        valid_items: List[TestDataItem],
+        invalid_items: List[TestDataItem],
+    ) -> Tuple[TestDataFile, TestDataFile, GeneratedTestCode]:
+        """Write the data files and validation script of an operation."""
         # Create data files
         valid_file = self._create_data_file(
             operation.operation_id, DataSetKind.VALID, valid_items
@@ -76,99 +184,111 @@ class TestDataGenerator:
 
         return valid_file, invalid_file, validation_script
 
-    def _generate_valid_data(
-        self,
-        operation: Operation,
-        os_deps: List[OperationSchemaDep],
-        ss_deps: List[SchemaSchemaDep],
-        parsed_spec: ParsedSpec,
-    ) -> List[TestDataItem]:
-        """Generate valid test data items for an operation."""
-        if self.llm_client:
-            # Use LLM to generate test data
-            valid_items = self._llm_generate_valid_data(operation, parsed_spec)
-        else:
-            # Fallback to basic template
-            valid_items = self._template_generate_valid_data(operation)
-
-        return valid_items
-
-    def _generate_invalid_data(
+    def _generate_data(
         self,
         operation: Operation,
         os_deps: List[OperationSchemaDep],
         ss_deps: List[SchemaSchemaDep],
         parsed_spec: ParsedSpec,
-    ) -> List[TestDataItem]:
-        """Generate invalid test data items for an operation."""
+    ) -> Tuple[List[TestDataItem], List[TestDataItem]]:
+        """Generate valid and invalid test data items for an operation."""
         if self.llm_client:
-            # Use LLM to generate invalid test data
-            invalid_items = self._llm_generate_invalid_data(operation, parsed_spec)
-        else:
-            # Fallback to basic template
-            invalid_items = self._template_generate_invalid_data(operation)
+            # Use LLM to generate both data sets in one round-trip
+            return self._llm_generate_both(operation, parsed_spec)
 
-        return invalid_items
+        # Fallback to basic template
+        return (
+            self._template_generate_valid_data(operation),
+            self._template_generate_invalid_data(operation),
+        )
 
-    def _llm_generate_valid_data(
+    def _llm_generate_both(
         self, operation: Operation, parsed_spec: ParsedSpec
-    ) -> List[TestDataItem]:
-        """Use LLM to generate valid test data."""
-        # This would use the LLM to generate realistic test data
-        # For demonstration, we'll return some basic template data
-        return self._template_generate_valid_data(operation)
+    ) -> Tuple[List[TestDataItem], List[TestDataItem]]:
+        """
+        Use LLM to generate valid and invalid test data in a single prompt.
 
-    def _llm_generate_invalid_data(
-        self, operation: Operation, parsed_spec: ParsedSpec
-    ) -> List[TestDataItem]:
-        """Use LLM to generate invalid test data."""
-        # This would use the LLM to generate invalid test data
-        # For demonstration, we'll return some basic template data
-        return self._template_generate_invalid_data(operation)
+        The client is expected to expose ``complete(prompt, response_format)
+        -> str`` returning JSON; a data set the model leaves empty or answers
+        malformed falls back to the template data.
+        """
+        valid_items: List[TestDataItem] = []
+        invalid_items: List[TestDataItem] = []
+        try:
+            raw = self.llm_client.complete(
+                self._build_llm_prompt(operation, parsed_spec),
+                response_format=_LLM_DATA_FORMAT,
+            )
+            answer = orjson.loads(raw)
+            valid_items = [TestDataItem(**item) for item in answer.get("valid", [])]
+            invalid_items = [TestDataItem(**item) for item in answer.get("invalid", [])]
+        except Exception as e:
+            print(f"Error in LLM test data generation: {e}")
+
+        return (
+            valid_items or self._template_generate_valid_data(operation),
+            invalid_items or self._template_generate_invalid_data(operation),
+        )
+
+    def _build_llm_prompt(self, operation: Operation, parsed_spec: ParsedSpec) -> str:
+        """Describe an operation and ask for both of its data sets at once."""
+        lines = [
+            f"Generate test data for the REST API operation {operation.operation_id}"
+            f" ({operation.method.value} {operation.path}) of {parsed_spec.title}.",
+            f"Summary: {operation.summary or '-'}",
+            "Parameters:",
+        ]
+        lines.extend(
+            f"- {param.name} ({param.in_.value}, {param.type},"
+            f" {'required' if param.required else 'optional'})"
+            for param in operation.parameters
+        )
+        lines.extend(
+            [
+                "Expected responses: "
+                + (
+                    ", ".join(str(resp.status_code) for resp in operation.responses)
+                    or "-"
+                ),
+                "Provide requests that should succeed as 'valid' and requests that"
+                " should be rejected as 'invalid', answering with JSON of the form "
+                '{"valid": [{"data": {...}, "expected_code": 200}], "invalid": [...]}.',
+            ]
+        )
+        return "\n".join(lines)
 
     def _template_generate_valid_data(self, operation: Operation) -> List[TestDataItem]:
         """Generate template-based valid test data."""
-        items = []
-
-        # Create a basic template based on method
-        if operation.method.value == "GET":
-            # For GET, create simple query params
-            data = {}
-            if operation.parameters:
-                # Add simple values for each parameter
-                for param in operation.parameters:
-                    if param.in_ == "query":
-                        if param.type == "string":
-                            data[param.name] = f"test_{param.name}"
-                        elif param.type == "integer":
-                            data[param.name] = 42
-                        elif param.type == "boolean":
-                            data[param.name] = True
-
-            items.append(TestDataItem(data=data, expected_code=200))
-
-        elif operation.method.value in ["POST", "PUT", "PATCH"]:
+        # Create a basic template based on method; enum members are singletons,
+        # so they are compared by identity
+        method = operation.method
+        expected_code = self._METHOD_EXPECTED.get(method)
+        if expected_code is None:
+            return []
+
+        if method is HTTPMethod.GET:
+            # For GET, create simple query params with a value for each one
+            param_templates = self._PARAM_TEMPLATES
+            data = {
+                param.name: gen(param.name)
+                for param in operation.parameters or ()
+                if param.in_ is ParameterLocation.QUERY
+                and (gen := param_templates.get(param.type)) is not None
+            }
+        else:
             # For write operations, create a simple body
             data = {"id": f"test_{uuid.uuid4()}"}
-            items.append(TestDataItem(data=data, expected_code=201))
 
-        return items[:1]  # Just return one template item for simplicity
+        # Just return one template item for simplicity
+        return [TestDataItem(data=data, expected_code=expected_code)]
 
     def _template_generate_invalid_data(
         self, operation: Operation
     ) -> List[TestDataItem]:
         """Generate template-based invalid test data."""
-        items = []
-
-        # Create an empty item (missing required fields)
-        items.append(TestDataItem(data={}, expected_code=400))
-
-        # Create an item with invalid type
-        if operation.method.value in ["POST", "PUT", "PATCH"]:
-            invalid_data = {"id": 12345}  # Assuming ID should be string
-            items.append(TestDataItem(data=invalid_data, expected_code=400))
-
-        return items[:1]  # Just return one template item for simplicity
+        # Create an empty item (missing required fields); only one template
+        # item is returned for simplicity, whatever the method
+        return [TestDataItem(data={}, expected_code=400)]
 
     def _create_data_file(
         self, operation_id: str, kind: DataSetKind, items: List[TestDataItem]
@@ -177,13 +297,16 @@ class TestDataGenerator:
         # Create file path
         file_path = self.output_dir / f"{operation_id}_{kind.value}.jsonl"
 
-        # Write data items to JSONL file
-        with open(file_path, "w") as f:
-            for item in items:
-                f.write(
-                    json.dumps({"data": item.data, "expected_code": item.expected_code})
-                    + "\n"
+        # Serialize all items compactly and write the JSONL file in one go
+        file_path.write_bytes(
+            b"".join(
+                orjson.dumps(
+                    {"data": item.data, "expected_code": item.expected_code},
+                    option=orjson.OPT_APPEND_NEWLINE,
                 )
+                for item in items
+            )
+        )
 
         # Create and return the file object
         return TestDataFile(
@@ -197,59 +320,9 @@ class TestDataGenerator:
         invalid_items: List[TestDataItem],
     ) -> GeneratedTestCode:
         """Generate a Python validation script for the test data."""
-        # Create a simple validation script template
-        script = f"""
-# Generated validation script for {operation.operation_id}
-import json
-
-def validate_request(data, expected_valid):
-    \"\"\"
-    Validate if request data meets the expected constraints.
-
-    Args:
-        data: Request payload to validate
-        expected_valid: Whether this data should be valid or not
-
-    Returns:
-        Tuple of (is_valid, message)
-    \"\"\"
-    # Basic validation rules for {operation.operation_id}
-    if expected_valid:
-        if not data:
-            return False, "Valid request cannot be empty"
-    else:
-        # For cases expected to be invalid, we still validate
-        # the structure to ensure they're invalid for the right reason
-        pass
-
-    return True, "Validation successful"
-
-def main():
-    # Load and validate test data files
-    valid_file = "{operation.operation_id}_valid.jsonl"
-    invalid_file = "{operation.operation_id}_invalid.jsonl"
-    
-    # Validate valid items
-    with open(valid_file, 'r') as f:
-        for line in f:
-            current_item = json.loads(line)
-            is_valid, message = validate_request(current_item['data'], True)
-            if not is_valid:
-                print(f"ERROR: Valid item failed validation: {{message}}")
-                print(f"Item: {{current_item}}")
-    
-    # Validate invalid items
-    with open(invalid_file, 'r') as f:
-        for line in f:
-            current_item = json.loads(line)
-            is_valid, message = validate_request(current_item['data'], False)
-            if not is_valid:
-                print(f"ERROR: Invalid item validation issue: {{message}}")
-                print(f"Item: {{current_item}}")
-
-if __name__ == "__main__":
-    main()
-"""
+        script = _VALIDATION_SCRIPT_TEMPLATE.substitute(
+            operation_id=operation.operation_id
+        )
 
         return GeneratedTestCode(
             operation_sequence_id=f"seq-{operation.operation_id}",
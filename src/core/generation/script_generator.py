@@ -3,175 +3,16 @@
 """Test script generation based on operation sequences and constraints."""
 
 import os
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Final, List, Optional, Tuple
 from pathlib import Path
 from schemas.dependency import OperationSequence
 from schemas.constraint import UnifiedConstraint
 from schemas.test_data import TestDataFile, GeneratedTestCode
 
-
-class TestScriptGenerator:
-    """
-    Core component for generating test scripts.
-
-    Creates executable test scripts based on operation sequences, unified constraints,
-    and available test data files.
-    """
-
-    def __init__(self, llm_client=None, output_dir: str = "test_scripts"):
-        """
-        Initialize the test script generator.
-
-        Args:
-            llm_client: Client for language model API calls
-            output_dir: Directory for storing generated test scripts
-        """
-        self.llm_client = llm_client
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def generate_scripts(
-        self,
-        operation_sequence: OperationSequence,
-        constraints: List[UnifiedConstraint],
-        data_files: List[TestDataFile],
-        language: str = "python",
-    ) -> List[GeneratedTestCode]:
-        """
-        Generate test scripts for an operation sequence.
-
-        Args:
-            operation_sequence: Sequence of operations to test
-            constraints: Unified constraints to verify
-            data_files: Test data files to use
-            language: Target programming language ("python" or "groovy")
-
-        Returns:
-            List of generated test code objects
-        """
-        if language.lower() not in ["python", "groovy"]:
-            raise ValueError("Supported languages are 'python' and 'groovy'")
-
-        # Group data files by operation ID for easy lookup
-        data_by_op = self._group_data_files(data_files)
-
-        # Group constraints by operation (assuming constraints have operation info)
-        constraints_by_op = self._group_constraints(constraints)
-
-        # Generate tests based on language
-        if language.lower() == "python":
-            return self._generate_python_tests(
-                operation_sequence, constraints_by_op, data_by_op
-            )
-        else:
-            return self._generate_groovy_tests(
-                operation_sequence, constraints_by_op, data_by_op
-            )
-
-    def _group_data_files(
-        self, data_files: List[TestDataFile]
-    ) -> Dict[str, Dict[str, TestDataFile]]:
-        """Group data files by operation ID and kind."""
-        result = {}
-
-        for file in data_files:
-            if file.operation_id not in result:
-                result[file.operation_id] = {}
-
-            result[file.operation_id][file.kind.value] = file
-
-        return result
-
-    def _group_constraints(
-        self, constraints: List[UnifiedConstraint]
-    ) -> Dict[str, List[UnifiedConstraint]]:
-        """Group constraints by operation ID (if available)."""
-        # This is a placeholder - in a real implementation we'd have a way to map
-        # constraints to operations, but for now we'll assume all constraints apply to all operations
-        return {"all": constraints}
-
-    def _generate_python_tests(
-        self,
-        operation_sequence: OperationSequence,
-        constraints_by_op: Dict[str, List[UnifiedConstraint]],
-        data_by_op: Dict[str, Dict[str, TestDataFile]],
-    ) -> List[GeneratedTestCode]:
-        """Generate Python pytest-compatible test scripts."""
-        # If we have an LLM client, use it to generate more sophisticated tests
-        if self.llm_client:
-            return self._llm_generate_python_tests(
-                operation_sequence, constraints_by_op, data_by_op
-            )
-
-        # Otherwise generate a simple template
-        return [
-            self._template_generate_python_test(
-                operation_sequence, constraints_by_op, data_by_op
-            )
-        ]
-
-    def _generate_groovy_tests(
-        self,
-        operation_sequence: OperationSequence,
-        constraints_by_op: Dict[str, List[UnifiedConstraint]],
-        data_by_op: Dict[str, Dict[str, TestDataFile]],
-    ) -> List[GeneratedTestCode]:
-        """Generate Groovy test scripts."""
-        # If we have an LLM client, use it to generate more sophisticated tests
-        if self.llm_client:
-            return self._llm_generate_groovy_tests(
-                operation_sequence, constraints_by_op, data_by_op
-            )
-
-        # Otherwise generate a simple template
-        return [
-            self._template_generate_groovy_test(
-                operation_sequence, constraints_by_op, data_by_op
-            )
-        ]
-
-    def _llm_generate_python_tests(
-        self,
-        operation_sequence: OperationSequence,
-        constraints_by_op: Dict[str, List[UnifiedConstraint]],
-        data_by_op: Dict[str, Dict[str, TestDataFile]],
-    ) -> List[GeneratedTestCode]:
-        """Use LLM to generate Python test scripts."""
-        # In a real implementation, this would use the LLM to generate scripts
-        # For now, we'll use the template approach
-        return [
-            self._template_generate_python_test(
-                operation_sequence, constraints_by_op, data_by_op
-            )
-        ]
-
-    def _llm_generate_groovy_tests(
-        self,
-        operation_sequence: OperationSequence,
-        constraints_by_op: Dict[str, List[UnifiedConstraint]],
-        data_by_op: Dict[str, Dict[str, TestDataFile]],
-    ) -> List[GeneratedTestCode]:
-        """Use LLM to generate Groovy test scripts."""
-        # In a real implementation, this would use the LLM to generate scripts
-        # For now, we'll use the template approach
-        return [
-            self._template_generate_groovy_test(
-                operation_sequence, constraints_by_op, data_by_op
-            )
-        ]
-
-    def _template_generate_python_test(
-        self,
-        operation_sequence: OperationSequence,
-        constraints_by_op: Dict[str, List[UnifiedConstraint]],
-        data_by_op: Dict[str, Dict[str, TestDataFile]],
-    ) -> GeneratedTestCode:
-        """Generate a template Python test script."""
-        operations = operation_sequence.operations
-        sequence_id = operation_sequence.sequence_id
-
-        # Header part
-        script = """
+# Static parts of the template Python test script
+_PY_HEADER: Final[str] = """
 import pytest
 import requests
 import json
@@ -215,8 +56,7 @@ def assert_status_code(response, expected_code):
     assert response.status_code == expected_code, f\"Expected {expected_code}, got {response.status_code}. Response: {response.text}\"
 """
 
-        # Add fixture for loading test data
-        script += """
+_PY_FIXTURE_HEADER: Final[str] = """
 # Test data loading fixtures
 @pytest.fixture
 def load_test_data():
@@ -227,10 +67,8 @@ def load_test_data():
     # Try to load all available test data files
 """
 
-        # Add data loading for each operation
-        for op_id in operations:
-            if op_id in data_by_op:
-                script += f"""
+# Per-operation and per-constraint fragments, filled with str.format_map
+_PY_DATA_LOADER: Final[str] = """
     # Load data for {op_id}
     op_data = {{}}
     for kind in ["valid", "invalid"]:
@@ -247,21 +85,18 @@ def load_test_data():
     data["{op_id}"] = op_data
 """
 
-        script += """
+_PY_FIXTURE_FOOTER: Final[str] = """
     return data
 """
 
-        # Add tests for the operation sequence
-        script += f"""
-class TestSequence{sequence_id.replace('-', '')}:
-    \"\"\"Test sequence for operation chain: {' -> '.join(operations)}\"\"\""
+_PY_CLASS_HEADER: Final[str] = """
+class TestSequence{class_suffix}:
+    \"\"\"Test sequence for operation chain: {chain}\"\"\""
     
 """
 
-        # Add test function for each operation
-        for i, op_id in enumerate(operations):
-            script += f"""
-    def test_{i+1:02d}_{op_id}(self, load_test_data):
+_PY_OP_TEST: Final[str] = """
+    def test_{idx:02d}_{op_id}(self, load_test_data):
         \"\"\"Test {op_id} operation\"\"\""
         # Load test data
         data = load_test_data.get("{op_id}", {{}})
@@ -284,12 +119,9 @@ class TestSequence{sequence_id.replace('-', '')}:
         assert_status_code(response, 200)  # Expected code should be adjusted
 """
 
-        # Add test functions for constraints
-        all_constraints = constraints_by_op.get("all", [])
-        for j, constraint in enumerate(all_constraints):
-            script += f"""
-    def test_constraint_{j+1:02d}(self):
-        \"\"\"Test constraint: {constraint.expression}\"\"\""
+_PY_CONSTRAINT_TEST: Final[str] = """
+    def test_constraint_{idx:02d}(self):
+        \"\"\"Test constraint: {expression}\"\"\""
         # This would check if the constraint was satisfied across responses
         # Simplified implementation:
         for op_id, response in test_state.responses.items():
@@ -299,27 +131,8 @@ class TestSequence{sequence_id.replace('-', '')}:
                 pass
 """
 
-        # Create file path for the script
-        file_path = self.output_dir / f"test_sequence_{sequence_id}.py"
-        with open(file_path, "w") as f:
-            f.write(script)
-
-        return GeneratedTestCode(
-            operation_sequence_id=sequence_id, language="python", content=script
-        )
-
-    def _template_generate_groovy_test(
-        self,
-        operation_sequence: OperationSequence,
-        constraints_by_op: Dict[str, List[UnifiedConstraint]],
-        data_by_op: Dict[str, Dict[str, TestDataFile]],
-    ) -> GeneratedTestCode:
-        """Generate a template Groovy test script."""
-        operations = operation_sequence.operations
-        sequence_id = operation_sequence.sequence_id
-
-        # Basic Groovy script structure for REST API testing
-        script = """
+# Static parts of the template Groovy test script
+_GROOVY_HEADER: Final[str] = """
 import groovy.json.JsonSlurper
 import groovy.json.JsonOutput
 
@@ -400,10 +213,7 @@ def loadTestData() {
     
 """
 
-        # Add data loading for each operation
-        for op_id in operations:
-            if op_id in data_by_op:
-                script += f"""
+_GROOVY_DATA_LOADER: Final[str] = """
     // Load data for {op_id}
     data['{op_id}'] = [valid: [], invalid: []]
     ['valid', 'invalid'].each {{ kindName ->
@@ -416,7 +226,7 @@ def loadTestData() {
     }}
 """
 
-        script += """
+_GROOVY_DATA_FOOTER: Final[str] = """
     return data
 }
 
@@ -426,10 +236,8 @@ def testData = loadTestData()
 println "Running test sequence..."
 """
 
-        # Add test steps for each operation
-        for i, op_id in enumerate(operations):
-            script += f"""
-// Step {i+1}: Test {op_id}
+_GROOVY_OP_STEP: Final[str] = """
+// Step {idx}: Test {op_id}
 println "Testing operation: {op_id}"
 
 def {op_id}Data = testData['{op_id}']?.valid?.get(0)?.data ?: [mock: "data"]
@@ -447,30 +255,349 @@ if ({op_id}Response.statusCode < 300 && {op_id}Response.json) {{
 assertStatusCode({op_id}Response, 200)  // Expected code should be adjusted
 """
 
-        # Add constraint checks
-        all_constraints = constraints_by_op.get("all", [])
-        if all_constraints:
-            script += """
+_GROOVY_CONSTRAINTS_HEADER: Final[str] = """
 // Check constraints
 println "Checking constraints..."
 """
 
-        for j, constraint in enumerate(all_constraints):
-            script += f"""
-// Constraint {j+1}: {constraint.expression}
+_GROOVY_CONSTRAINT: Final[str] = """
+// Constraint {idx}: {expression}
 // In a real implementation, we would evaluate the constraint expression
 // against the appropriate response based on operation mapping
 """
 
-        script += """
+_GROOVY_FOOTER: Final[str] = """
 println "Test sequence completed successfully!"
 """
 
+# Header of the Python translation of the template Groovy test script
+_PY_EQUIVALENT_HEADER: Final[str] = """
+import os
+
+import requests
+
+# Base configuration
+BASE_URL = os.environ.get('API_BASE_URL', 'http://localhost:8000')
+HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}
+
+
+def test_sequence():
+    responses = {}
+"""
+
+_PY_EQUIVALENT_STEP: Final[str] = """
+    # Step {idx}: Test {op_id}
+    response = requests.get(f"{{BASE_URL}}/{op_id}", headers=HEADERS)
+    responses['{op_id}'] = response
+    assert response.status_code == 200, (
+        f"Expected status 200, got {{response.status_code}}. Response: {{response.text}}"
+    )
+"""
+
+
+# Large enough that a typical script reaches the OS in a single write
+_WRITE_BUFFER_SIZE: Final[int] = 1 << 20
+
+
+@lru_cache(maxsize=4096)
+def _render_op_fragment(template: str, op_id: str, idx: int = 0) -> str:
+    """Render a per-operation fragment, reusing it for repeated operations."""
+    return template.format_map({"idx": idx, "op_id": op_id})
+
+
+class TestScriptGenerator:
+    """
+    Core component for generating test scripts.
+
+    Creates executable test scripts based on operation sequences, unified constraints,
+    and available test data files.
+    """
+
+    def __init__(self, llm_client=None, output_dir: str = "test_scripts"):
+        """
+        Initialize the test script generator.
+
+        Args:
+            llm_client: Client for language model API calls
+            output_dir: Directory for storing generated test scripts
+        """
+        self.llm_client = llm_client
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def generate_scripts(
+        self,
+        operation_sequence: OperationSequence,
+        constraints: List[UnifiedConstraint],
+        data_files: List[TestDataFile],
+        language: str = "python",
+        return_content: bool = True,
+    ) -> List[GeneratedTestCode]:
+        """
+        Generate test scripts for an operation sequence.
+
+        Args:
+            operation_sequence: Sequence of operations to test
+            constraints: Unified constraints to verify
+            data_files: Test data files to use
+            language: Target programming language ("python" or "groovy")
+            return_content: Whether to keep the script source in the returned
+                objects; when False the scripts are only written to disk
+
+        Returns:
+            List of generated test code objects
+        """
+        language = language.lower()
+        if language not in ["python", "groovy"]:
+            raise ValueError("Supported languages are 'python' and 'groovy'")
+
+        # Group data files by operation ID for easy lookup
+        data_by_op = self._group_data_files(data_files)
+
+        # Group constraints by operation (assuming constraints have operation info)
+        constraints_by_op = self._group_constraints(constraints)
+
+        # Generate tests based on language
+        generate = (
+            self._generate_python_tests
+            if language == "python"
+            else self._generate_groovy_tests
+        )
+        return generate(
+            operation_sequence, constraints_by_op, data_by_op, return_content
+        )
+
+    def _group_data_files(
+        self, data_files: List[TestDataFile]
+    ) -> Dict[str, Dict[str, TestDataFile]]:
+        """Group data files by operation ID and kind."""
+        result: Dict[str, Dict[str, TestDataFile]] = defaultdict(dict)
+
+        for file in data_files:
+            result[file.operation_id][file.kind.value] = file
+
+        # Hand back a plain dict so lookups of unknown operations don't insert
+        return dict(result)
+
+    def _group_constraints(
+        self, constraints: List[UnifiedConstraint]
+    ) -> Dict[str, List[UnifiedConstraint]]:
+        """Group constraints by operation ID (if available)."""
+        # This is a placeholder - in a real implementation we'd have a way to map
+        # constraints to operations, but for now we'll assume all constraints apply to all operations
+        return {"all": constraints}
+
+    def _generate_python_tests(
+        self,
+        operation_sequence: OperationSequence,
+        constraints_by_op: Dict[str, List[UnifiedConstraint]],
+        data_by_op: Dict[str, Dict[str, TestDataFile]],
+        return_content: bool = True,
+    ) -> List[GeneratedTestCode]:
+        """Generate Python pytest-compatible test scripts."""
+        # If we have an LLM client, use it to generate more sophisticated tests
+        if self.llm_client:
+            return self._llm_generate_python_tests(
+                operation_sequence, constraints_by_op, data_by_op, return_content
+            )
+
+        # Otherwise generate a simple template
+        return [
+            self._template_generate_python_test(
+                operation_sequence, constraints_by_op, data_by_op, return_content
+            )
+        ]
+
+    def _generate_groovy_tests(
+        self,
+        operation_sequence: OperationSequence,
+        constraints_by_op: Dict[str, List[UnifiedConstraint]],
+        data_by_op: Dict[str, Dict[str, TestDataFile]],
+        return_content: bool = True,
+    ) -> List[GeneratedTestCode]:
+        """Generate Groovy test scripts."""
+        # If we have an LLM client, use it to generate more sophisticated tests
+        if self.llm_client:
+            return self._llm_generate_groovy_tests(
+                operation_sequence, constraints_by_op, data_by_op, return_content
+            )
+
+        # Otherwise generate a simple template
+        return [
+            self._template_generate_groovy_test(
+                operation_sequence, constraints_by_op, data_by_op, return_content
+            )
+        ]
+
+    def _llm_generate_python_tests(
+        self,
+        operation_sequence: OperationSequence,
+        constraints_by_op: Dict[str, List[UnifiedConstraint]],
+        data_by_op: Dict[str, Dict[str, TestDataFile]],
+        return_content: bool = True,
+    ) -> List[GeneratedTestCode]:
+        """Use LLM to generate Python test scripts."""
+        # In a real implementation, this would use the LLM to generate scripts
+        # For now, we'll use the template approach
+        return [
+            self._template_generate_python_test(
+                operation_sequence, constraints_by_op, data_by_op, return_content
+            )
+        ]
+
+    def _llm_generate_groovy_tests(
+        self,
+        operation_sequence: OperationSequence,
+        constraints_by_op: Dict[str, List[UnifiedConstraint]],
+        data_by_op: Dict[str, Dict[str, TestDataFile]],
+        return_content: bool = True,
+    ) -> List[GeneratedTestCode]:
+        """Use LLM to generate Groovy test scripts."""
+        # In a real implementation, this would use the LLM to generate scripts
+        # For now, we'll use the template approach
+        return [
+            self._template_generate_groovy_test(
+                operation_sequence, constraints_by_op, data_by_op, return_content
+            )
+        ]
+
+    def _template_generate_python_test(
+        self,
+        operation_sequence: OperationSequence,
+        constraints_by_op: Dict[str, List[UnifiedConstraint]],
+        data_by_op: Dict[str, Dict[str, TestDataFile]],
+        return_content: bool = True,
+    ) -> GeneratedTestCode:
+        """Generate a template Python test script."""
+        operations = operation_sequence.operations
+        sequence_id = operation_sequence.sequence_id
+
+        # Header part and fixture for loading test data
+        parts: List[str] = [_PY_HEADER, _PY_FIXTURE_HEADER]
+
+        # Add data loading for each operation
+        for op_id in operations:
+            if op_id in data_by_op:
+                parts.append(_render_op_fragment(_PY_DATA_LOADER, op_id))
+
+        parts.append(_PY_FIXTURE_FOOTER)
+
+        # Add tests for the operation sequence
+        parts.append(
+            _PY_CLASS_HEADER.format_map(
+                {
+                    "class_suffix": sequence_id.replace("-", ""),
+                    "chain": " -> ".join(operations),
+                }
+            )
+        )
+
+        # Add test function for each operation
+        for i, op_id in enumerate(operations):
+            parts.append(_render_op_fragment(_PY_OP_TEST, op_id, i + 1))
+
+        # Add test functions for constraints
+        all_constraints = constraints_by_op.get("all", [])
+        for j, constraint in enumerate(all_constraints):
+            parts.append(
+                _PY_CONSTRAINT_TEST.format_map(
+                    {"idx": j + 1, "expression": constraint.expression}
+                )
+            )
+
+        # Create file path for the script
+        file_path = self.output_dir / f"test_sequence_{sequence_id}.py"
+        script = self._write_script(file_path, parts, return_content)
+
+        return GeneratedTestCode(
+            operation_sequence_id=sequence_id, language="python", content=script
+        )
+
+    def _template_generate_groovy_test(
+        self,
+        operation_sequence: OperationSequence,
+        constraints_by_op: Dict[str, List[UnifiedConstraint]],
+        data_by_op: Dict[str, Dict[str, TestDataFile]],
+        return_content: bool = True,
+    ) -> GeneratedTestCode:
+        """Generate a template Groovy test script."""
+        operations = operation_sequence.operations
+        sequence_id = operation_sequence.sequence_id
+
+        # Basic Groovy script structure for REST API testing
+        parts: List[str] = [_GROOVY_HEADER]
+
+        # Add data loading for each operation
+        for op_id in operations:
+            if op_id in data_by_op:
+                parts.append(_render_op_fragment(_GROOVY_DATA_LOADER, op_id))
+
+        parts.append(_GROOVY_DATA_FOOTER)
+
+        # Add test steps for each operation
+        for i, op_id in enumerate(operations):
+            parts.append(_render_op_fragment(_GROOVY_OP_STEP, op_id, i + 1))
+
+        # Add constraint checks
+        all_constraints = constraints_by_op.get("all", [])
+        if all_constraints:
+            parts.append(_GROOVY_CONSTRAINTS_HEADER)
+
+        for j, constraint in enumerate(all_constraints):
+            parts.append(
+                _GROOVY_CONSTRAINT.format_map(
+                    {"idx": j + 1, "expression": constraint.expression}
+                )
+            )
+
+        parts.append(_GROOVY_FOOTER)
+
         # Create file path for the script
         file_path = self.output_dir / f"test_sequence_{sequence_id}.groovy"
-        with open(file_path, "w") as f:
-            f.write(script)
+        script = self._write_script(file_path, parts, return_content)
 
         return GeneratedTestCode(
-            operation_sequence_id=sequence_id, language="groovy", content=script
+            operation_sequence_id=sequence_id,
+            language="groovy",
+            content=script,
+            python_equivalent=self._template_python_equivalent(operations),
         )
+
+    def _write_script(
+        self, file_path: Path, parts: List[str], return_content: bool
+    ) -> str:
+        """
+        Stream the fragments of a script to its file.
+
+        Args:
+            file_path: Destination of the script
+            parts: Script fragments in order
+            return_content: Whether to also assemble the full script source
+
+        Returns:
+            The script source, or an empty string if it was not requested
+        """
+        with file_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(parts)
+
+        return "".join(parts) if return_content else ""
+
+    def _template_python_equivalent(self, operations: List[str]) -> str:
+        """
+        Translate the template Groovy test steps into an equivalent pytest module.
+
+        The template only issues HTTP requests and status code assertions, so
+        it maps one to one onto ``requests`` calls; this lets the executor skip
+        starting a JVM for it.
+        """
+        parts: List[str] = [_PY_EQUIVALENT_HEADER]
+
+        # Request bodies are only sent for write methods, so the GET steps of
+        # the template never use their test data
+        for i, op_id in enumerate(operations):
+            parts.append(_render_op_fragment(_PY_EQUIVALENT_STEP, op_id, i + 1))
+
+        return "".join(parts)
@@ -3,10 +3,23 @@
 """Constraint combiner for merging static and dynamic constraints."""
 
 import uuid
+import itertools
 import re
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
 from schemas.constraint import StaticConstraint, DynamicInvariant, UnifiedConstraint
 
+# Property references such as "response.items.length"
+_RESPONSE_PROP_RE = re.compile(r"response\.([a-zA-Z0-9_\.]+)")
+
+# Inequality comparisons against an integer such as ">= 10"
+_INEQ_RE = re.compile(r"([<>]=?)\s*(\d+)")
+
+# Ids are a per-process random prefix plus a counter, avoiding a urandom
+# read for every constraint created
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_ID_COUNTER = itertools.count()
+
 
 class ConstraintCombiner:
     """
@@ -36,58 +49,78 @@ class ConstraintCombiner:
         # Start by adding all static constraints
         for constraint in static_constraints:
             unified = UnifiedConstraint(
-                id=f"unified-{uuid.uuid4()}",
+                id=f"unified-{_ID_PREFIX}-{next(_ID_COUNTER)}",
                 expression=constraint.expression,
                 originating_ids=[constraint.id],
             )
             unified_constraints.append(unified)
 
+        # Index unified constraints by the response properties they reference,
+        # keeping each constraint's property set so it is extracted only once
+        prop_index: Dict[str, Set[int]] = defaultdict(set)
+        unified_props: List[Set[str]] = []
+        for idx, unified in enumerate(unified_constraints):
+            props = set(_RESPONSE_PROP_RE.findall(unified.expression))
+            unified_props.append(props)
+            self._index_constraint(prop_index, idx, props)
+
         # Process dynamic invariants
         for invariant in dynamic_invariants:
-            matching = self._find_matching_constraints(invariant, unified_constraints)
+            inv_props = set(_RESPONSE_PROP_RE.findall(invariant.expression))
+            matching = self._find_matching_constraints(inv_props, prop_index)
 
             if matching:
                 # For each match, decide whether to update, merge or leave as-is
-                for match in matching:
+                for idx in matching:
+                    match = unified_constraints[idx]
                     merged = self._merge_constraints(match, invariant)
                     if merged and merged != match:
-                        # Update with merged version
-                        idx = unified_constraints.index(match)
+                        # Update with merged version and re-index its properties
                         unified_constraints[idx] = merged
+                        for prop in unified_props[idx]:
+                            prop_index[prop].discard(idx)
+                        if merged.expression == invariant.expression:
+                            merged_props = inv_props
+                        else:
+                            merged_props = set(
+                                _RESPONSE_PROP_RE.findall(merged.expression)
+                            )
+                        unified_props[idx] = merged_props
+                        self._index_constraint(prop_index, idx, merged_props)
             else:
                 # Add as new constraint
                 unified = UnifiedConstraint(
-                    id=f"unified-{uuid.uuid4()}",
+                    id=f"unified-{_ID_PREFIX}-{next(_ID_COUNTER)}",
                     expression=invariant.expression,
                     originating_ids=[invariant.id],
                 )
+                self._index_constraint(prop_index, len(unified_constraints), inv_props)
+                unified_props.append(inv_props)
                 unified_constraints.append(unified)
 
         return unified_constraints
 
-    def _find_matching_constraints(
-        self, invariant: DynamicInvariant, unified_constraints: List[UnifiedConstraint]
-    ) -> List[UnifiedConstraint]:
-        """Find unified constraints that target the same variables as an invariant."""
-        matches = []
-
-        for constraint in unified_constraints:
-            # Simple string matching for demo - would be more sophisticated in real impl
-            if self._constraints_overlap(constraint.expression, invariant.expression):
-                matches.append(constraint)
+    def _index_constraint(
+        self, prop_index: Dict[str, Set[int]], idx: int, props: Set[str]
+    ) -> None:
+        """Record the position of a constraint under each property it references."""
+        for prop in props:
+            prop_index[prop].add(idx)
 
-        return matches
-
-    def _constraints_overlap(self, expr1: str, expr2: str) -> bool:
-        """Check if two constraint expressions reference the same variables."""
-        # Simple heuristic: check if both expressions reference the same property
+    def _find_matching_constraints(
+        self, props: Set[str], prop_index: Dict[str, Set[int]]
+    ) -> List[int]:
+        """
+        Find unified constraints that target the same variables as an invariant.
 
-        # Extract property names from expressions
-        props1 = re.findall(r"response\.([a-zA-Z0-9_\.]+)", expr1)
-        props2 = re.findall(r"response\.([a-zA-Z0-9_\.]+)", expr2)
+        Args:
+            props: Response properties referenced by the dynamic invariant
+            prop_index: Positions of unified constraints by referenced property
 
-        # Look for overlap
-        return any(p1 == p2 for p1 in props1 for p2 in props2)
+        Returns:
+            Positions of the matching unified constraints, in ascending order
+        """
+        return sorted(set().union(*(prop_index.get(prop, ()) for prop in props)))
 
     def _merge_constraints(
         self, unified: UnifiedConstraint, invariant: DynamicInvariant
@@ -116,8 +149,8 @@ class ConstraintCombiner:
         # possibly with an LLM to compare the constraints
 
         # Look for inequality comparisons
-        ineq1 = re.search(r"([<>]=?)\s*(\d+)", expr1)
-        ineq2 = re.search(r"([<>]=?)\s*(\d+)", expr2)
+        ineq1 = _INEQ_RE.search(expr1)
+        ineq2 = _INEQ_RE.search(expr2)
 
         if not ineq1 or not ineq2:
             # Can't compare, return first
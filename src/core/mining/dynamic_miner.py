@@ -2,13 +2,83 @@
 
 """Dynamic invariant mining from API execution logs."""
 
+import os
 import re
 import uuid
+import itertools
+import array
+import math
 import collections
-from typing import Dict, List, Set, Any
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, Any, Tuple
 from schemas.system_io import HTTPResponse
 from schemas.constraint import DynamicInvariant
 
+# Ids are a per-process random prefix plus a counter, avoiding a urandom
+# read for every invariant created
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_ID_COUNTER = itertools.count()
+
+
+def _reset_id_prefix() -> None:
+    global _ID_PREFIX
+    _ID_PREFIX = uuid.uuid4().hex[:8]
+
+
+# Forked pool workers inherit the counter, so give each its own prefix
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_prefix)
+
+# Total number of logs from which endpoint groups are mined in parallel;
+# below it process start-up outweighs the gain
+_PARALLEL_MIN_LOGS = 5000
+
+# Exact types of the numbers a decoded JSON body holds (bool counts as int)
+_NUMERIC_TYPES = frozenset((int, float, bool))
+
+# Miner and log groups of a parallel discovery, set in each pool worker
+_worker_state: Optional[Tuple["DynamicInvariantMiner", List[List[HTTPResponse]]]] = None
+
+
+def _init_worker(
+    miner: "DynamicInvariantMiner", groups: List[List[HTTPResponse]]
+) -> None:
+    global _worker_state
+    _worker_state = (miner, groups)
+
+
+def _discover_group(index: int) -> List[DynamicInvariant]:
+    miner, groups = _worker_state
+    return miner._discover_endpoint_invariants(groups[index])
+
+
+@dataclass(slots=True)
+class _PropStats:
+    """Observations of one property path accumulated over an endpoint's logs."""
+
+    count: int = 0
+    # Contiguous double buffer keeps large log sets compact for min()
+    numeric_values: Optional[array.array] = field(
+        default_factory=lambda: array.array("d")
+    )
+    always_array: bool = True
+
+    def observe(self, value: Any) -> None:
+        self.count += 1
+        if self.numeric_values is not None:
+            if type(value) in _NUMERIC_TYPES:
+                try:
+                    self.numeric_values.append(value)
+                except OverflowError:
+                    # Integers beyond double range only matter for their sign
+                    self.numeric_values.append(math.inf if value > 0 else -math.inf)
+            else:
+                self.numeric_values = None
+        if self.always_array and not isinstance(value, list):
+            self.always_array = False
+
 
 class DynamicInvariantMiner:
     """
@@ -38,25 +108,57 @@ class DynamicInvariantMiner:
 
         invariants = []
 
-        # Process each endpoint-method group
-        for endpoint_method, logs in grouped_logs.items():
-            endpoint_invariants = self._discover_endpoint_invariants(logs)
+        # Process each endpoint-method group, spreading large log sets over
+        # processes since the work is CPU bound
+        groups = list(grouped_logs.values())
+        workers = min(len(groups), os.cpu_count() or 1)
+        if workers > 1 and len(execution_logs) >= _PARALLEL_MIN_LOGS:
+            results = self._discover_parallel(groups, workers)
+        else:
+            results = map(self._discover_endpoint_invariants, groups)
+
+        for endpoint_invariants in results:
             invariants.extend(endpoint_invariants)
 
         return invariants
 
-    def _group_logs(self, logs: List[HTTPResponse]) -> Dict[str, List[HTTPResponse]]:
-        """Group logs by endpoint-method combination."""
+    def _discover_parallel(
+        self, groups: List[List[HTTPResponse]], workers: int
+    ) -> List[List[DynamicInvariant]]:
+        """
+        Discover the invariants of each log group in a process pool.
+
+        The groups are handed to the workers through the pool initializer, so
+        forked workers inherit them instead of receiving pickled copies of the
+        logs; only group indices and the mined invariants cross processes.
+        """
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self, groups),
+            ) as executor:
+                return list(executor.map(_discover_group, range(len(groups))))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Error in parallel invariant discovery, running serially: {e}")
+            return [self._discover_endpoint_invariants(logs) for logs in groups]
+
+    def _group_logs(
+        self, logs: List[HTTPResponse]
+    ) -> Dict[Tuple[Tuple[str, ...], str], List[HTTPResponse]]:
+        """
+        Group logs by endpoint-method combination.
+
+        Keys pair the first two URL path segments (e.g. ("v1", "charges") for
+        /v1/charges/ch_1) with the HTTP method.
+        """
         grouped = collections.defaultdict(list)
 
         for log in logs:
-            # Extract endpoint from URL path
-            url_parts = log.url.path.split("/")
-
             # Simple heuristic to identify endpoint pattern - would be more sophisticated in real impl
-            endpoint = "/".join([""] + url_parts[1:3])  # e.g., /v1/charges
+            url_parts = log.url.path.split("/", 3)
 
-            key = f"{endpoint}:{log.method.value}"
+            key = (tuple(url_parts[1:3]), log.method.value)
             grouped[key].append(log)
 
         return grouped
@@ -68,128 +170,118 @@ class DynamicInvariantMiner:
         if not logs:
             return []
 
-        invariants = []
-
-        # Extract response properties
-        properties = self._extract_response_properties(logs)
+        # Walk every response body once, collecting properties and stats
+        properties, stats = self._collect_stats(logs)
+        complete = [
+            (prop, stats[prop])
+            for prop in properties
+            if prop in stats and stats[prop].count == len(logs)
+        ]
+
+        # Each check yields at most one invariant per property, so build the
+        # result with comprehensions rather than growing it by repeated extends
+
+        # Check for range invariants on properties that are always numeric
+        invariants = [
+            invariant
+            for prop, prop_stats in complete
+            if prop_stats.numeric_values is not None
+            for invariant in self._check_range_invariants(
+                prop, prop_stats.numeric_values
+            )
+        ]
 
-        # Look for numeric properties
-        numeric_props = self._identify_numeric_properties(logs, properties)
+        # Check for size invariants for properties that are always arrays
+        invariants += [
+            invariant
+            for prop, prop_stats in complete
+            if prop_stats.always_array
+            for invariant in self._check_size_invariants(logs, prop)
+        ]
 
-        # Check for range invariants
-        for prop in numeric_props:
-            range_invariants = self._check_range_invariants(logs, prop)
-            invariants.extend(range_invariants)
+        return invariants
 
-        # Check for size invariants for arrays
-        array_props = self._identify_array_properties(logs, properties)
-        for prop in array_props:
-            size_invariants = self._check_size_invariants(logs, prop)
-            invariants.extend(size_invariants)
+    def _collect_stats(
+        self, logs: List[HTTPResponse]
+    ) -> Tuple[Set[str], Dict[str, _PropStats]]:
+        """
+        Extract response properties and per-property stats in a single pass.
 
-        return invariants
+        Args:
+            logs: Responses of one endpoint-method combination
 
-    def _extract_response_properties(self, logs: List[HTTPResponse]) -> Set[str]:
-        """Extract all response properties from logs."""
-        properties = set()
+        Returns:
+            Tuple of (all flattened response properties, stats of the values
+            found at each dot-notation path reachable through objects only)
+        """
+        properties: Set[str] = set()
+        stats: Dict[str, _PropStats] = collections.defaultdict(_PropStats)
 
         for log in logs:
-            flat_props = self._flatten_json(log.body)
-            properties.update(flat_props)
+            self._flatten_json(log.body, properties, stats)
 
-        return properties
+        return properties, stats
 
-    def _flatten_json(self, json_obj, prefix="") -> Set[str]:
-        """Flatten a nested JSON object into dot-notation properties."""
-        properties = set()
+    def _flatten_json(
+        self,
+        json_obj,
+        properties: Set[str],
+        stats: Dict[str, _PropStats],
+    ) -> None:
+        """
+        Flatten a nested JSON object into dot-notation properties.
+
+        Values reachable from the root through objects alone are also recorded
+        in ``stats``; nothing inside arrays is. Keys containing a dot, and the
+        children of an empty top-level key, do not round-trip through a
+        dot-notation path, so nothing below them is recorded.
 
-        if isinstance(json_obj, dict):
-            for key, value in json_obj.items():
+        The walk keeps an explicit stack of object iterators instead of
+        recursing, visiting properties in the same depth-first order.
+        """
+        stack: List[Tuple[Any, str, Optional[Dict[str, _PropStats]]]] = []
+
+        def descend(value, prefix: str, value_stats) -> None:
+            # Arrays contribute the structure of their first item only
+            while isinstance(value, list):
+                if not value:
+                    return
+                if not isinstance(value[0], (dict, list)):
+                    properties.add(f"{prefix}[]")
+                    return
+                value, value_stats = value[0], None
+            if isinstance(value, dict):
+                stack.append((iter(value.items()), prefix, value_stats))
+
+        descend(json_obj, "", stats)
+        while stack:
+            items, prefix, obj_stats = stack[-1]
+            for key, value in items:
                 new_prefix = f"{prefix}.{key}" if prefix else key
+                child_stats = obj_stats if "." not in key else None
+                if child_stats is not None:
+                    child_stats[new_prefix].observe(value)
                 if isinstance(value, (dict, list)):
-                    properties.update(self._flatten_json(value, new_prefix))
-                else:
-                    properties.add(new_prefix)
-        elif isinstance(json_obj, list) and json_obj:
-            # Only process first item in arrays to get structure
-            if json_obj and isinstance(json_obj[0], (dict, list)):
-                array_props = self._flatten_json(json_obj[0], prefix)
-                properties.update(array_props)
-            else:
-                properties.add(f"{prefix}[]")
-
-        return properties
-
-    def _identify_numeric_properties(
-        self, logs: List[HTTPResponse], properties: Set[str]
-    ) -> Set[str]:
-        """Identify properties that always contain numeric values."""
-        numeric_props = set(properties)
-
-        for prop in properties:
-            for log in logs:
-                value = self._get_nested_value(log.body, prop)
-                if value is None or not isinstance(value, (int, float)):
-                    # Remove non-numeric properties
-                    if prop in numeric_props:
-                        numeric_props.remove(prop)
+                    descend(value, new_prefix, child_stats if new_prefix else None)
                     break
-
-        return numeric_props
-
-    def _identify_array_properties(
-        self, logs: List[HTTPResponse], properties: Set[str]
-    ) -> Set[str]:
-        """Identify properties that always contain arrays."""
-        array_props = set()
-
-        for prop in properties:
-            is_array = True
-            for log in logs:
-                value = self._get_nested_value(log.body, prop)
-                if not isinstance(value, list):
-                    is_array = False
-                    break
-
-            if is_array:
-                array_props.add(prop)
-
-        return array_props
-
-    def _get_nested_value(self, json_obj, property_path):
-        """Get a value from a nested JSON object using dot notation."""
-        parts = property_path.split(".")
-        current = json_obj
-
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
+                properties.add(new_prefix)
             else:
-                return None
-
-        return current
+                stack.pop()
 
     def _check_range_invariants(
-        self, logs: List[HTTPResponse], property_path: str
+        self, property_path: str, values: Sequence[float]
     ) -> List[DynamicInvariant]:
-        """Check for range invariants on numeric properties."""
+        """Check for range invariants on the collected values of a numeric property."""
         invariants = []
-        values = []
-
-        # Collect values
-        for log in logs:
-            value = self._get_nested_value(log.body, property_path)
-            if value is not None:
-                values.append(value)
 
         if not values:
             return []
 
-        # Check for non-negative
-        if all(v >= 0 for v in values):
+        # Check for non-negative with a single C-level pass
+        if min(values) >= 0:
             invariants.append(
                 DynamicInvariant(
-                    id=f"dynamic-{uuid.uuid4()}",
+                    id=f"dynamic-{_ID_PREFIX}-{next(_ID_COUNTER)}",
                     variables=[f"response.{property_path}"],
                     expression=f"response.{property_path} >= 0",
                 )
@@ -206,7 +298,7 @@ class DynamicInvariantMiner:
         # Check if size is always non-negative (trivial but demonstrates concept)
         invariants.append(
             DynamicInvariant(
-                id=f"dynamic-{uuid.uuid4()}",
+                id=f"dynamic-{_ID_PREFIX}-{next(_ID_COUNTER)}",
                 variables=[f"size(response.{property_path})"],
                 expression=f"size(response.{property_path}) >= 0",
             )
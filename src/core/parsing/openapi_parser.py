@@ -2,11 +2,13 @@
 
 """OpenAPI/Swagger specification parser."""
 
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Union
 
 import yaml
-import json
+import orjson
 from pydantic import ValidationError
 
 from schemas.specification import (
@@ -21,6 +23,31 @@ from schemas.specification import (
 
 from schemas.common import HTTPMethod
 
+# Prefer the libyaml-backed loader, which parses large specs much faster
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+# Bytes inspected to tell a JSON spec from a YAML one, and the first
+# significant characters of a JSON document, as text or bytes
+_SNIFF_SIZE = 64
+_JSON_STARTS = frozenset(("{", "[", b"{", b"["))
+
+# Parsed specs by (path, mtime in ns, size), so re-parsing an unchanged file
+# is skipped; kept small since each entry holds a whole spec
+_PARSE_CACHE: "OrderedDict[Tuple[str, int, int], ParsedSpec]" = OrderedDict()
+_PARSE_CACHE_SIZE = 16
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# HTTP methods by their upper-case name, for one lookup per path item key
+_METHOD_MAP: Dict[str, HTTPMethod] = {m.value: m for m in HTTPMethod}
+
+# Parameter locations by their "in" value
+_PARAM_LOC_MAP: Dict[str, ParameterLocation] = {
+    loc.value: loc for loc in ParameterLocation
+}
+
 
 class OpenAPIParser:
     """
@@ -51,23 +78,39 @@ class OpenAPIParser:
             return self._raw_spec
 
         if self.spec_content:
-            content = self.spec_content
-        else:
-            with open(self.spec_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            self._raw_spec = self._parse_content(self.spec_content)
+            return self._raw_spec
 
-        try:
-            # Try parsing as JSON first
-            self._raw_spec = json.loads(content)
-        except json.JSONDecodeError:
-            # Fall back to YAML parsing
-            try:
-                self._raw_spec = yaml.safe_load(content)
-            except yaml.YAMLError as e:
-                raise ValueError(f"Failed to parse OpenAPI spec: {e}")
+        with open(self.spec_path, "rb") as f:
+            # Sniff the first significant byte: JSON documents are read whole
+            # for orjson, anything else is handed to the YAML parser as a
+            # stream so the file is never held in memory as a string
+            if f.peek(_SNIFF_SIZE).lstrip()[:1] in _JSON_STARTS:
+                self._raw_spec = self._parse_content(f.read())
+            else:
+                try:
+                    self._raw_spec = yaml.load(f, Loader=_YAMLLoader)
+                except yaml.YAMLError as e:
+                    raise ValueError(f"Failed to parse OpenAPI spec: {e}")
 
         return self._raw_spec
 
+    def _parse_content(self, content: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse specification content, trying JSON first and then YAML."""
+        # Only content starting like a JSON document is worth trying as JSON;
+        # YAML specs go straight to the YAML parser
+        if content[:_SNIFF_SIZE].lstrip()[:1] in _JSON_STARTS:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+
+        # Fall back to YAML parsing
+        try:
+            return yaml.load(content, Loader=_YAMLLoader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Failed to parse OpenAPI spec: {e}")
+
     def parse(self) -> ParsedSpec:
         """
         Parse the OpenAPI specification into the system's schema model.
@@ -75,6 +118,38 @@ class OpenAPIParser:
         Returns:
             ParsedSpec object containing the structured representation of the API
         """
+        key = self._cache_key()
+        if key is not None:
+            with _PARSE_CACHE_LOCK:
+                cached = _PARSE_CACHE.get(key)
+                if cached is not None:
+                    _PARSE_CACHE.move_to_end(key)
+            if cached is not None:
+                # Callers may mutate the result, so never hand out the entry
+                return cached.model_copy(deep=True)
+
+        parsed = self._parse_spec()
+
+        if key is not None:
+            with _PARSE_CACHE_LOCK:
+                _PARSE_CACHE[key] = parsed.model_copy(deep=True)
+                while len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                    _PARSE_CACHE.popitem(last=False)
+
+        return parsed
+
+    def _cache_key(self) -> Optional[Tuple[str, int, int]]:
+        """Identify the on-disk spec version, or None if it is not cacheable."""
+        if self.spec_content or self.spec_path is None:
+            return None
+        try:
+            stat = Path(self.spec_path).stat()
+        except OSError:
+            return None
+        return (str(Path(self.spec_path).resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def _parse_spec(self) -> ParsedSpec:
+        """Build the ParsedSpec from the raw specification."""
         spec = self._load_spec()
 
         # Extract basic info
@@ -97,14 +172,9 @@ class OpenAPIParser:
 
         for path, path_item in spec.get("paths", {}).items():
             for method_name, operation_data in path_item.items():
-                # Skip non-HTTP method keys
-                if method_name.upper() not in [m.value for m in HTTPMethod]:
-                    continue
-
-                # Get HTTP method enum value
-                try:
-                    method = HTTPMethod(method_name.upper())
-                except ValueError:
+                # Get HTTP method enum value, skipping non-HTTP method keys
+                method = _METHOD_MAP.get(method_name.upper())
+                if method is None:
                     continue
 
                 # Extract operation details
@@ -144,7 +214,9 @@ class OpenAPIParser:
 
         for param in parameters:
             try:
-                param_location = ParameterLocation(param.get("in", "query"))
+                param_location = _PARAM_LOC_MAP.get(
+                    param.get("in", "query"), ParameterLocation.QUERY
+                )
 
                 result.append(
                     OperationParameter(
@@ -194,6 +266,9 @@ class OpenAPIParser:
     def _parse_components(self, spec: Dict[str, Any]) -> Dict[str, ResponseSchema]:
         """Extract component schemas from the spec."""
         components = {}
+        # Identical property shapes recur across schemas (ids, pagination
+        # fields, ...), so build each distinct one only once
+        seen_props: Dict[Tuple[Any, ...], SchemaProperty] = {}
 
         for schema_name, schema_data in (
             spec.get("components", {}).get("schemas", {}).items()
@@ -201,12 +276,23 @@ class OpenAPIParser:
             properties = {}
 
             for prop_name, prop_data in schema_data.get("properties", {}).items():
-                properties[prop_name] = SchemaProperty(
-                    name=prop_name,
-                    type=prop_data.get("type", "object"),
-                    description=prop_data.get("description"),
-                    example=prop_data.get("example"),
+                fields = (
+                    prop_name,
+                    prop_data.get("type", "object"),
+                    prop_data.get("description"),
+                    prop_data.get("example"),
                 )
+                # The example's type keeps e.g. true and 1 apart
+                key = (*fields, type(fields[3]))
+                try:
+                    prop = seen_props.get(key)
+                except TypeError:
+                    # Unhashable fields are invalid; let validation report them
+                    properties[prop_name] = self._build_property(*fields)
+                    continue
+                if prop is None:
+                    prop = seen_props[key] = self._build_property(*fields)
+                properties[prop_name] = prop
 
             components[schema_name] = ResponseSchema(
                 name=schema_name, properties=properties
@@ -214,6 +300,14 @@ class OpenAPIParser:
 
         return components
 
+    def _build_property(
+        self, name: str, type: Any, description: Any, example: Any
+    ) -> SchemaProperty:
+        """Create a schema property from its OpenAPI fields."""
+        return SchemaProperty(
+            name=name, type=type, description=description, example=example
+        )
+
 
 def parse_openapi(file_path: Path, content: str) -> Dict[str, Any]:
     """
@@ -5,6 +5,7 @@
 import json
 import os
 import time
+import threading
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime
@@ -14,6 +15,12 @@ from schemas.test_execution import TestResults, TestOutcome, TestStatus
 from schemas.experience_reinforcement import ReinforcementUpdate, PromptTemplate
 from schemas.dependency import ODGEdge
 
+# Unique edge index, which also backs the upsert in update_odg_edge
+_CREATE_EDGE_INDEX = """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_odg_edge
+    ON odg_weights(src_operation, dst_operation)
+"""
+
 
 class ExperienceReinforcement:
     """
@@ -30,13 +37,28 @@ class ExperienceReinforcement:
             db_path: Path to the SQLite database for storing experience
         """
         self.db_path = db_path
+        # One connection serves every call; the lock serializes its use
+        # across threads
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
         self._initialize_db()
 
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _initialize_db(self):
         """Initialize the SQLite database for storing experience."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
 
+        # Write-ahead logging lets readers proceed during writes and makes
+        # commits cheaper; the mode is stored in the database file
+        cursor.execute("PRAGMA journal_mode=WAL")
+        # WAL stays consistent without syncing on every commit
+        cursor.execute("PRAGMA synchronous=NORMAL")
+
         # Create tables if they don't exist
         cursor.execute(
             """
@@ -80,8 +102,26 @@ class ExperienceReinforcement:
         """
         )
 
+        # Index the lookup columns so edge upserts and name queries don't scan
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_outcomes_name ON test_outcomes(test_name)"
+        )
+        try:
+            cursor.execute(_CREATE_EDGE_INDEX)
+        except sqlite3.IntegrityError:
+            # Databases written by a racing check-then-insert may hold duplicate
+            # edges; keep the latest row of each before enforcing uniqueness
+            cursor.execute(
+                """
+                DELETE FROM odg_weights WHERE id NOT IN (
+                    SELECT MAX(id) FROM odg_weights
+                    GROUP BY src_operation, dst_operation
+                )
+                """
+            )
+            cursor.execute(_CREATE_EDGE_INDEX)
+
         conn.commit()
-        conn.close()
 
     def process_results(self, test_results: TestResults) -> ReinforcementUpdate:
         """
@@ -108,27 +148,28 @@ class ExperienceReinforcement:
 
     def _store_results(self, test_results: TestResults):
         """Store test results in the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn
 
-        for outcome in test_results.outcomes:
-            cursor.execute(
-                """
-                INSERT INTO test_outcomes 
-                (test_name, status, expected, actual, details)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    outcome.test_name,
-                    outcome.status.value,
-                    outcome.expected or "",
-                    outcome.actual or "",
-                    outcome.details or "",
-                ),
-            )
-
-        conn.commit()
-        conn.close()
+        # Insert every outcome in one statement and transaction
+        with self._lock:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO test_outcomes 
+                    (test_name, status, expected, actual, details)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            outcome.test_name,
+                            outcome.status.value,
+                            outcome.expected or "",
+                            outcome.actual or "",
+                            outcome.details or "",
+                        )
+                        for outcome in test_results.outcomes
+                    ],
+                )
 
     def _update_prompts(self, test_results: TestResults) -> List[PromptTemplate]:
         """
@@ -145,15 +186,11 @@ class ExperienceReinforcement:
         # 2. Use LLM to refine prompt templates based on success/failure patterns
         # 3. Update the database with new templates
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         # Get current templates
-        cursor.execute("SELECT name, template_text, version FROM prompt_templates")
-        templates = cursor.fetchall()
-
-        # Close connection before returning
-        conn.close()
+        with self._lock:
+            templates = self._conn.execute(
+                "SELECT name, template_text, version FROM prompt_templates"
+            ).fetchall()
 
         # Create PromptTemplate objects for each template
         refined_templates = [
@@ -197,12 +234,11 @@ class ExperienceReinforcement:
         # 2. Analyze sequence correctness based on test outcomes
         # 3. Update weights for edges in the ODG
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         # Get current weights
-        cursor.execute("SELECT src_operation, dst_operation, weight FROM odg_weights")
-        weights = cursor.fetchall()
+        with self._lock:
+            weights = self._conn.execute(
+                "SELECT src_operation, dst_operation, weight FROM odg_weights"
+            ).fetchall()
 
         for src, dst, weight in weights:
             edge_key = f"{src}->{dst}"
@@ -211,20 +247,14 @@ class ExperienceReinforcement:
             # In a real implementation, we would update weights based on test outcomes
             # For example, increase weight if tests for this edge were successful
 
-        # Close connection
-        conn.close()
-
         return updated_weights
 
     def get_prompt_templates(self) -> List[PromptTemplate]:
         """Get all prompt templates from the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT name, template_text, version FROM prompt_templates")
-        templates = cursor.fetchall()
-
-        conn.close()
+        with self._lock:
+            templates = self._conn.execute(
+                "SELECT name, template_text, version FROM prompt_templates"
+            ).fetchall()
 
         return [
             PromptTemplate(name=name, template_text=template, version=version)
@@ -233,13 +263,10 @@ class ExperienceReinforcement:
 
     def get_odg_weights(self) -> Dict[str, float]:
         """Get all ODG edge weights from the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT src_operation, dst_operation, weight FROM odg_weights")
-        weights = cursor.fetchall()
-
-        conn.close()
+        with self._lock:
+            weights = self._conn.execute(
+                "SELECT src_operation, dst_operation, weight FROM odg_weights"
+            ).fetchall()
 
         return {f"{src}->{dst}": weight for src, dst, weight in weights}
 
@@ -253,25 +280,24 @@ class ExperienceReinforcement:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn
 
-        try:
-            cursor.execute(
-                """
-                INSERT INTO prompt_templates
-                (name, template_text, version, success_rate, usage_count)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (template.name, template.template_text, template.version, 0.0, 0),
-            )
-            conn.commit()
-            success = True
-        except sqlite3.Error:
-            conn.rollback()
-            success = False
-        finally:
-            conn.close()
+        with self._lock:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO prompt_templates
+                    (name, template_text, version, success_rate, usage_count)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (template.name, template.template_text, template.version, 0.0, 0),
+                )
+                conn.commit()
+                success = True
+            except sqlite3.Error:
+                conn.rollback()
+                success = False
 
         return success
 
@@ -289,47 +315,27 @@ class ExperienceReinforcement:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn
 
-        try:
-            # Check if edge exists
-            cursor.execute(
-                """
-                SELECT COUNT(*) FROM odg_weights
-                WHERE src_operation = ? AND dst_operation = ?
-                """,
-                (src_operation, dst_operation),
-            )
-            count = cursor.fetchone()[0]
-
-            if count > 0:
-                # Update existing edge
-                cursor.execute(
-                    """
-                    UPDATE odg_weights
-                    SET weight = ?, last_updated = CURRENT_TIMESTAMP
-                    WHERE src_operation = ? AND dst_operation = ?
-                    """,
-                    (weight, src_operation, dst_operation),
-                )
-            else:
-                # Insert new edge
+        with self._lock:
+            cursor = conn.cursor()
+            try:
+                # Insert the edge, or update its weight if it already exists
                 cursor.execute(
                     """
                     INSERT INTO odg_weights
                     (src_operation, dst_operation, weight)
                     VALUES (?, ?, ?)
+                    ON CONFLICT(src_operation, dst_operation) DO UPDATE
+                    SET weight = excluded.weight, last_updated = CURRENT_TIMESTAMP
                     """,
                     (src_operation, dst_operation, weight),
                 )
 
-            conn.commit()
-            success = True
-        except sqlite3.Error:
-            conn.rollback()
-            success = False
-        finally:
-            conn.close()
+                conn.commit()
+                success = True
+            except sqlite3.Error:
+                conn.rollback()
+                success = False
 
         return success
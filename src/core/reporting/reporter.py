@@ -3,11 +3,17 @@
 """Test results reporting and dashboard generation."""
 
 import os
-import json
+import re
+import contextlib
+import functools
+import uuid
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import IO, Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import orjson
 
 from schemas.test_execution import (
     TestResults,
@@ -18,6 +24,146 @@ from schemas.test_execution import (
     DashboardArtifact,
 )
 
+# Operation ID in the last dotted part of a test name, which might be like
+# "test_01_getUser" or "test_execution.TestSequence1.test_01_get_user"
+_TEST_NAME_RE = re.compile(r"test(?:_\d+)?_(.+)")
+
+# Escapes text placed in HTML cells in a single C-level pass per string
+_HTML_ESCAPE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+def _escape(text: str) -> str:
+    """Escape text for use as HTML element content."""
+    return text.translate(_HTML_ESCAPE)
+
+
+# Static parts and row templates of the HTML report
+_HTML_HEADER = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>API Test Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
+        .container {{ max-width: 1200px; margin: 0 auto; padding: 20px; }}
+        h1, h2, h3 {{ color: #333; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; }}
+        th {{ background-color: #f2f2f2; text-align: left; }}
+        tr:nth-child(even) {{ background-color: #f9f9f9; }}
+        .success {{ color: green; }}
+        .failure {{ color: red; }}
+        .unknown {{ color: orange; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>API Test Report</h1>
+        <p>Generated: {generated_at}</p>
+        
+        <h2>Coverage Summary</h2>
+        <table>
+            <tr>
+                <th>Operation</th>
+                <th>Documented Codes</th>
+                <th>Covered Codes</th>
+                <th>Undocumented Codes</th>
+                <th>False Positives</th>
+            </tr>
+"""
+
+_HTML_COVERAGE_ROW = """
+            <tr>
+                <td>{operation_id}</td>
+                <td>{documented_codes}</td>
+                <td>{covered_codes}</td>
+                <td>{undocumented_codes}</td>
+                <td>{false_positive_count}</td>
+            </tr>"""
+
+_HTML_MISMATCH_HEADER = """
+        </table>
+        
+        <h2>Mismatches</h2>
+        <table>
+            <tr>
+                <th>Test</th>
+                <th>Expected</th>
+                <th>Actual</th>
+                <th>Details</th>
+            </tr>
+"""
+
+_HTML_MISMATCH_ROW = """
+            <tr class="failure">
+                <td>{test_name}</td>
+                <td>{expected}</td>
+                <td>{actual}</td>
+                <td>{details}</td>
+            </tr>"""
+
+_HTML_FOOTER = """
+        </table>
+    </div>
+</body>
+</html>
+"""
+
+
+@functools.lru_cache(maxsize=4096)
+def _likely_false_positive(expected: str, actual: str, details: str) -> bool:
+    """
+    Decide whether a mismatch with the given fields is likely a false positive.
+
+    Memoized since large runs repeat the same expected/actual/details values.
+    """
+    # Simple heuristic: look for common signs of false positives
+    if details and "expected schema not found" in details.lower():
+        return True
+
+    if expected and actual:
+        # Check if expected and actual values are semantically equivalent
+        try:
+            # Handle numeric comparisons (e.g., "200" == 200)
+            if expected.isdigit() and actual.isdigit():
+                return int(expected) == int(actual)
+
+            # Handle boolean comparisons (e.g., "true" == True)
+            if expected.lower() in [
+                "true",
+                "false",
+            ] and actual.lower() in ["true", "false"]:
+                return expected.lower() == actual.lower()
+
+        except (ValueError, AttributeError):
+            pass
+
+    return False
+
+
+@contextlib.contextmanager
+def _atomic_open(path: Path, mode: str, **kwargs) -> Iterator[IO]:
+    """
+    Open a temporary file next to path that replaces it once fully written.
+
+    Readers never see a partially written report, and a failed write leaves
+    the previous report in place.
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    # Created like open() would, so the process umask sets the final mode
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with open(fd, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 class Reporter:
     """
@@ -27,15 +173,46 @@ class Reporter:
     and aggregated dashboards.
     """
 
-    def __init__(self, output_dir: str = "reports"):
+    def __init__(self, output_dir: str = "reports", background: bool = False):
         """
         Initialize the reporter.
 
         Args:
             output_dir: Directory for storing reports
+            background: Whether generate_report returns before the report
+                files are written; wait_for_reports() or leaving the reporter
+                as a context manager then waits for them
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.background = background
+
+        # Writes the HTML and JSON reports in parallel, started on first use
+        # in background mode
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+
+    def __enter__(self) -> "Reporter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.wait_for_reports()
+        finally:
+            if self._writer is not None:
+                self._writer.shutdown()
+                self._writer = None
+
+    def wait_for_reports(self) -> None:
+        """
+        Block until every report file submitted so far has been written.
+
+        Raises:
+            Exception: The first error raised while writing a report
+        """
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
 
     def generate_report(
         self, results: TestResults, api_spec_info: Optional[Dict] = None
@@ -48,7 +225,10 @@ class Reporter:
             api_spec_info: Optional API specification info for coverage calculation
 
         Returns:
-            Dashboard artifact with coverage and mismatch reports
+            Dashboard artifact with coverage and mismatch reports; in
+            background mode the report files are written asynchronously, so
+            call wait_for_reports() before reading them and don't mutate the
+            dashboard until then
         """
         # Extract test outcomes
         outcomes = results.outcomes
@@ -66,11 +246,17 @@ class Reporter:
             coverage_reports=coverage_reports, mismatches=mismatches
         )
 
-        # Write HTML report
-        self._generate_html_report(dashboard)
-
-        # Write JSON report
-        self._generate_json_report(dashboard)
+        # Write HTML and JSON reports
+        if self.background:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="report-writer"
+                )
+            for write in (self._generate_html_report, self._generate_json_report):
+                self._pending.append(self._writer.submit(write, dashboard))
+        else:
+            self._generate_html_report(dashboard)
+            self._generate_json_report(dashboard)
 
         return dashboard
 
@@ -92,36 +278,35 @@ class Reporter:
 
         for outcome in outcomes:
             # Try to extract operation ID from test name
-            parts = outcome.test_name.split("_")
-            if len(parts) >= 2 and parts[0].startswith("test"):
-                # Format might be like "test_01_getUser"
-                op_id = parts[-1]
-                operation_outcomes[op_id].append(outcome)
-            else:
-                # If no clear pattern, put in "unknown" bucket
-                operation_outcomes["unknown"].append(outcome)
+            match = _TEST_NAME_RE.fullmatch(outcome.test_name.rpartition(".")[2])
+            # If no clear pattern, put in "unknown" bucket
+            op_id = match.group(1) if match else "unknown"
+            operation_outcomes[op_id].append(outcome)
+
+        # Index documented status codes from API spec once, if available
+        documented_by_op: Dict[str, Set[int]] = defaultdict(set)
+        if api_spec_info and "operations" in api_spec_info:
+            for op in api_spec_info.get("operations", []):
+                documented_by_op[op.get("operation_id")].update(
+                    response.get("status_code", 0)
+                    for response in op.get("responses", [])
+                )
 
         # Generate coverage report for each operation
         coverage_reports = []
 
         for op_id, op_outcomes in operation_outcomes.items():
-            # Extract documented status codes from API spec if available
-            documented_codes = set()
-            if api_spec_info and "operations" in api_spec_info:
-                for op in api_spec_info.get("operations", []):
-                    if op.get("operation_id") == op_id:
-                        for response in op.get("responses", []):
-                            documented_codes.add(response.get("status_code", 0))
+            documented_codes = documented_by_op.get(op_id, set())
 
             # Extract covered status codes from outcomes
-            covered_codes = set()
-            undocumented_codes = set()
-            for outcome in op_outcomes:
-                if outcome.actual and outcome.actual.isdigit():
-                    code = int(outcome.actual)
-                    covered_codes.add(code)
-                    if documented_codes and code not in documented_codes:
-                        undocumented_codes.add(code)
+            covered_codes = {
+                int(outcome.actual)
+                for outcome in op_outcomes
+                if outcome.actual and outcome.actual.isdigit()
+            }
+            undocumented_codes = (
+                covered_codes - documented_codes if documented_codes else set()
+            )
 
             # Count false positives (tests reporting mismatches incorrectly)
             false_positive_count = sum(
@@ -158,122 +343,68 @@ class Reporter:
         Returns:
             True if likely a false positive, False otherwise
         """
-        # Simple heuristic: look for common signs of false positives
-        if outcome.details and "expected schema not found" in outcome.details.lower():
-            return True
-
-        if outcome.expected and outcome.actual:
-            # Check if expected and actual values are semantically equivalent
-            try:
-                # Handle numeric comparisons (e.g., "200" == 200)
-                if outcome.expected.isdigit() and outcome.actual.isdigit():
-                    return int(outcome.expected) == int(outcome.actual)
-
-                # Handle boolean comparisons (e.g., "true" == True)
-                if outcome.expected.lower() in [
-                    "true",
-                    "false",
-                ] and outcome.actual.lower() in ["true", "false"]:
-                    return outcome.expected.lower() == outcome.actual.lower()
-
-            except (ValueError, AttributeError):
-                pass
-
-        return False
+        return _likely_false_positive(
+            outcome.expected or "", outcome.actual or "", outcome.details or ""
+        )
 
     def _generate_html_report(self, dashboard: DashboardArtifact):
         """Generate an HTML report from the dashboard."""
         html_path = self.output_dir / "report.html"
 
-        # Simple HTML template
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>API Test Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-        .container {{ max-width: 1200px; margin: 0 auto; padding: 20px; }}
-        h1, h2, h3 {{ color: #333; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; }}
-        th {{ background-color: #f2f2f2; text-align: left; }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        .success {{ color: green; }}
-        .failure {{ color: red; }}
-        .unknown {{ color: orange; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>API Test Report</h1>
-        <p>Generated: {dashboard.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
-        
-        <h2>Coverage Summary</h2>
-        <table>
-            <tr>
-                <th>Operation</th>
-                <th>Documented Codes</th>
-                <th>Covered Codes</th>
-                <th>Undocumented Codes</th>
-                <th>False Positives</th>
-            </tr>
-"""
-
-        for report in dashboard.coverage_reports:
-            html += f"""
-            <tr>
-                <td>{report.operation_id}</td>
-                <td>{', '.join(map(str, report.stats.documented_codes))}</td>
-                <td>{', '.join(map(str, report.stats.covered_codes))}</td>
-                <td>{', '.join(map(str, report.stats.undocumented_codes))}</td>
-                <td>{report.false_positive_count}</td>
-            </tr>"""
-
-        html += """
-        </table>
-        
-        <h2>Mismatches</h2>
-        <table>
-            <tr>
-                <th>Test</th>
-                <th>Expected</th>
-                <th>Actual</th>
-                <th>Details</th>
-            </tr>
-"""
-
-        for mismatch in dashboard.mismatches:
-            html += f"""
-            <tr class="failure">
-                <td>{mismatch.test_name}</td>
-                <td>{mismatch.expected or 'N/A'}</td>
-                <td>{mismatch.actual or 'N/A'}</td>
-                <td>{mismatch.details or 'N/A'}</td>
-            </tr>"""
-
-        html += """
-        </table>
-    </div>
-</body>
-</html>
-"""
+        # Write rows as they are formatted rather than building one string
+        with _atomic_open(html_path, "w", encoding="utf-8") as f:
+            f.write(
+                _HTML_HEADER.format_map(
+                    {
+                        "generated_at": dashboard.generated_at.strftime(
+                            "%Y-%m-%d %H:%M:%S"
+                        )
+                    }
+                )
+            )
 
-        with open(html_path, "w") as f:
-            f.write(html)
+            for report in dashboard.coverage_reports:
+                f.write(
+                    _HTML_COVERAGE_ROW.format_map(
+                        {
+                            "operation_id": _escape(report.operation_id),
+                            "documented_codes": ", ".join(
+                                map(str, report.stats.documented_codes)
+                            ),
+                            "covered_codes": ", ".join(
+                                map(str, report.stats.covered_codes)
+                            ),
+                            "undocumented_codes": ", ".join(
+                                map(str, report.stats.undocumented_codes)
+                            ),
+                            "false_positive_count": report.false_positive_count,
+                        }
+                    )
+                )
+
+            f.write(_HTML_MISMATCH_HEADER)
+
+            for mismatch in dashboard.mismatches:
+                f.write(
+                    _HTML_MISMATCH_ROW.format_map(
+                        {
+                            "test_name": _escape(mismatch.test_name),
+                            "expected": _escape(mismatch.expected or "N/A"),
+                            "actual": _escape(mismatch.actual or "N/A"),
+                            "details": _escape(mismatch.details or "N/A"),
+                        }
+                    )
+                )
+
+            f.write(_HTML_FOOTER)
 
     def _generate_json_report(self, dashboard: DashboardArtifact):
         """Generate a JSON report from the dashboard."""
         json_path = self.output_dir / "report.json"
 
-        # Convert dashboard to dictionary
-        dashboard_dict = dashboard.dict()
-
-        # Convert datetime to string for JSON serialization
-        dashboard_dict["generated_at"] = dashboard.generated_at.isoformat()
+        # Convert dashboard to JSON-ready primitives in one serializer pass
+        dashboard_dict = dashboard.model_dump(mode="json")
 
         # Write to file
-        with open(json_path, "w") as f:
-            json.dump(dashboard_dict, f, indent=2)
+        with _atomic_open(json_path, "wb") as f:
+            f.write(orjson.dumps(dashboard_dict, option=orjson.OPT_INDENT_2))
@@ -2,19 +2,203 @@
 
 """Semantic verification of generated test code."""
 
+import io
 import os
+import re
 import sys
-import json
-import pytest
+import shutil
+import signal
+import inspect
+import functools
+import contextlib
+import hashlib
+import orjson
 import tempfile
-import importlib
+import subprocess
+import importlib.util
+import weakref
+import threading
 import traceback
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree
 from schemas.test_data import GeneratedTestCode, VerifiedTestCode
 from schemas.json_types import JSON
 
+# Directory holding the cache of test modules, shared with the agent cache
+_CACHE_DIR_ENV = "KAT_RBC_CACHE_DIR"
+
+# Maximum number of test modules kept in the cache before the oldest go
+_MAX_CACHED_MODULES = 1024
+
+# Directory to create the run directory in, instead of the default
+_TMPDIR_ENV = "KAT_RBC_TMPDIR"
+
+# RAM-backed file system used for the run directory when available
+_SHM_DIR = "/dev/shm"
+
+# Environment variable naming the examples.json of the current batch
+_EXAMPLES_ENV = "KAT_RBC_VERIFIER_EXAMPLES"
+
+# pytest configuration of the module cache; it keeps pytest from picking up
+# configuration files from the directories above
+_PYTEST_INI = "[pytest]\n"
+
+# pytest exit codes of a completed run: all passed, some failed, none collected
+_PYTEST_RUN_CODES = frozenset((0, 1, 5))
+
+# pytest-xdist is optional; without it the batch runs in a single pytest process
+_XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+# Mock responses of the requests functions, shared by the conftest.py and the
+# tests verified without pytest
+_MOCK_RESPONSES = """
+import json
+
+class MockResponse:
+    def __init__(self, status_code, json_data, headers=None):
+        self.status_code = status_code
+        self._json_data = json_data
+        self.headers = headers or {"Content-Type": "application/json"}
+        self.text = json.dumps(json_data) if json_data else ""
+    
+    def json(self):
+        return self._json_data
+
+def mock_request(*args, **kwargs):
+    # Default to 200 OK with empty response
+    return MockResponse(200, {})
+"""
+
+# requests functions replaced by mock_request while a test runs
+_MOCKED_REQUEST_FUNCTIONS = ("request", "get", "post", "put", "patch", "delete")
+
+# conftest.py shared by every cached Python test module; pytest loads it once
+# per batch and applies its autouse fixture to all of them
+_MOCK_CONFTEST = (
+    """
+import pytest
+import os
+import json
+import unittest.mock as mock
+import requests
+from pathlib import Path
+
+# Mock responses based on spec examples
+EXAMPLES = json.loads(Path(os.environ["%s"]).read_bytes())
+""" % _EXAMPLES_ENV
+    + _MOCK_RESPONSES
+    + """
+# Mock requests to return examples
+@pytest.fixture(autouse=True)
+def mock_requests(monkeypatch):
+    monkeypatch.setattr(requests, "request", mock_request)
+    monkeypatch.setattr(requests, "get", mock_request)
+    monkeypatch.setattr(requests, "post", mock_request)
+    monkeypatch.setattr(requests, "put", mock_request)
+    monkeypatch.setattr(requests, "patch", mock_request)
+    monkeypatch.setattr(requests, "delete", mock_request)
+
+"""
+)
+
+# Content that needs pytest itself: its API, fixtures, xunit-style setup and
+# teardown, unittest classes or coroutines
+_NEEDS_PYTEST_RE = re.compile(
+    r"pytest\.|fixture|conftest|setup|teardown|unittest|async\s+def", re.IGNORECASE
+)
+
+
+class _VerificationTimeout(BaseException):
+    """Raised in a test verified without pytest once it ran out of time."""
+
+
+def _raise_timeout(signum, frame) -> None:
+    raise _VerificationTimeout
+
+
+def _run_method(cls: type, method: Callable) -> None:
+    """Run a test method on a fresh instance of its class, like pytest."""
+    method(cls())
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_request() -> Callable:
+    """Compile the mock responses once and return their request function."""
+    namespace: Dict[str, Any] = {}
+    exec(_MOCK_RESPONSES, namespace)
+    return namespace["mock_request"]
+
+
+def _module_cache_dir() -> Path:
+    """Resolve the directory caching test modules and their bytecode."""
+    base = os.environ.get(_CACHE_DIR_ENV) or Path.home() / ".cache" / "kat-rbc"
+    return Path(base) / "verifier"
+
+
+def _evict_modules(module_dir: Path, keep: Set[str]) -> None:
+    """
+    Trim the module cache to _MAX_CACHED_MODULES, dropping the oldest first.
+
+    Modules are never rewritten, so their modification time is when they
+    were cached. The modules in keep, those of the current batch, stay.
+    """
+    entries = []
+    with os.scandir(module_dir) as it:
+        for entry in it:
+            if entry.name.startswith("test_") and entry.name.endswith(".py"):
+                entries.append((entry.stat().st_mtime_ns, entry.name[:-3]))
+
+    excess = len(entries) - _MAX_CACHED_MODULES
+    if excess <= 0:
+        return
+
+    entries.sort()
+    pycache = module_dir / "__pycache__"
+    for _, module in entries:
+        if excess <= 0:
+            break
+        if module in keep:
+            continue
+        (module_dir / f"{module}.py").unlink(missing_ok=True)
+        for pyc in pycache.glob(f"{module}.*.pyc"):
+            pyc.unlink(missing_ok=True)
+        excess -= 1
+
+
+def _scratch_base() -> Optional[str]:
+    """Pick the parent of the run directory, preferring a RAM-backed one."""
+    base = os.environ.get(_TMPDIR_ENV) or _SHM_DIR
+    if os.path.isdir(base) and os.access(base, os.W_OK | os.X_OK):
+        return base
+    return None
+
+
+def _write_if_changed(path: Path, content: bytes) -> None:
+    """
+    Atomically replace path with content unless it already holds it.
+
+    Leaving an unchanged file alone keeps its modification time, so the
+    bytecode pytest cached for it stays valid.
+    """
+    try:
+        if path.read_bytes() == content:
+            return
+    except FileNotFoundError:
+        pass
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with open(fd, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def _dump_examples(spec_examples: Dict[str, JSON]) -> bytes:
+    """Serialize the examples, turning non-string keys into strings like json."""
+    return orjson.dumps(spec_examples, option=orjson.OPT_NON_STR_KEYS)
+
 
 class SemanticVerifier:
     """
@@ -24,14 +208,50 @@ class SemanticVerifier:
     Tests that fail against their own examples are discarded.
     """
 
-    def __init__(self, execution_timeout: int = 10):
+    def __init__(
+        self,
+        execution_timeout: int = 10,
+        parallel_workers: Optional[int] = None,
+        in_process: bool = False,
+    ):
         """
         Initialize the semantic verifier.
 
         Args:
             execution_timeout: Maximum execution time for tests in seconds
+            parallel_workers: Number of pytest-xdist workers for the Python
+                batch when xdist is installed, defaults to the number of CPU
+                cores minus two
+            in_process: Whether to run plain Python tests directly in this
+                process instead of in pytest. Only enable it for trusted test
+                code when nothing else runs in the process: the tests patch
+                the process-wide requests module, their output is captured
+                from every thread, a test stuck in C code ignores the timeout,
+                and a crashing test takes the process down
         """
         self.execution_timeout = execution_timeout
+        self.in_process = in_process
+        self.parallel_workers = parallel_workers or max(1, (os.cpu_count() or 1) - 2)
+
+        # Test modules are cached by content, so pytest reuses the bytecode it
+        # compiled for a test that was already verified, even by an earlier
+        # process
+        self._module_dir = _module_cache_dir()
+        self._cache_ready = False
+
+        # Run directory reused by every batch of this verifier, in memory
+        # where possible; its files are overwritten in place
+        self._scratch = Path(tempfile.mkdtemp(prefix="kat-rbc-", dir=_scratch_base()))
+        # Removed by close(), once the verifier is garbage collected, or at
+        # exit, whichever comes first
+        self._cleanup = weakref.finalize(
+            self, shutil.rmtree, self._scratch, ignore_errors=True
+        )
+        self._run_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Remove the run directory of this verifier."""
+        self._cleanup()
 
     def verify_tests(
         self, generated_tests: List[GeneratedTestCode], spec_examples: Dict[str, JSON]
@@ -39,6 +259,10 @@ class SemanticVerifier:
         """
         Verify generated tests against specification examples.
 
+        Python tests are verified together by a single pytest run; with
+        in_process enabled, those that only need the requests mock are run
+        directly in this process instead.
+
         Args:
             generated_tests: Generated test code to verify
             spec_examples: Example responses from API specification
@@ -46,10 +270,35 @@ class SemanticVerifier:
         Returns:
             List of semantically verified test code
         """
+        # Plain tests may be verified right here, the rest go to the pytest batch
+        results: Dict[int, bool] = {}
+        batch: List[int] = []
+        for i, test_code in enumerate(generated_tests):
+            if test_code.language.lower() != "python":
+                continue
+            passed = (
+                self._verify_python_test_fast(test_code) if self.in_process else None
+            )
+            if passed is None:
+                batch.append(i)
+            else:
+                results[i] = passed
+
+        if batch:
+            # The examples are serialized once for the whole batch
+            batch_passed = self._verify_python_tests(
+                [generated_tests[i] for i in batch], _dump_examples(spec_examples)
+            )
+            results.update(zip(batch, batch_passed))
+
         verified_tests = []
 
-        for test_code in generated_tests:
-            if self._verify_test(test_code, spec_examples):
+        for i, test_code in enumerate(generated_tests):
+            passed = results.get(i)
+            if passed is None:
+                passed = self._verify_test(test_code, spec_examples)
+
+            if passed:
                 verified_test = VerifiedTestCode(
                     **test_code.dict(), verified_at=datetime.utcnow()
                 )
@@ -73,93 +322,312 @@ class SemanticVerifier:
             True if test passed verification, False otherwise
         """
         if test_code.language.lower() == "python":
-            return self._verify_python_test(test_code, spec_examples)
+            examples_json = _dump_examples(spec_examples)
+            return self._verify_python_tests([test_code], examples_json)[0]
         elif test_code.language.lower() == "groovy":
             return self._verify_groovy_test(test_code, spec_examples)
         else:
             print(f"Unsupported language for verification: {test_code.language}")
             return False
 
-    def _verify_python_test(
-        self, test_code: GeneratedTestCode, spec_examples: Dict[str, JSON]
-    ) -> bool:
+    def _verify_python_test_fast(self, test_code: GeneratedTestCode) -> Optional[bool]:
         """
-        Verify Python test code by executing it against examples.
+        Verify plain Python test code in this process, without pytest.
+
+        Only code that needs nothing from pytest but the requests mock is
+        run: module level ``test*`` functions and ``Test*`` classes whose
+        ``test*`` methods take no arguments. Each test runs with the requests
+        functions patched, under a timer of execution_timeout seconds.
 
         Args:
             test_code: Generated Python test code
-            spec_examples: Example responses from API specification
 
         Returns:
-            True if test passed verification, False otherwise
+            True if the test passed verification, False if it failed, or None
+            if the test has to be verified by pytest
         """
-        # Create a temporary directory for test execution
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        content = test_code.content
+        # The timer relies on SIGALRM, which only the main thread receives
+        if (
+            _NEEDS_PYTEST_RE.search(content)
+            or not hasattr(signal, "setitimer")
+            or threading.current_thread() is not threading.main_thread()
+        ):
+            return None
+
+        try:
+            requests = importlib.import_module("requests")
+        except ImportError:
+            return None
+
+        try:
+            code = compile(content, f"<{test_code.operation_sequence_id}>", "exec")
+        except (SyntaxError, ValueError):
+            # pytest would fail to collect the module
+            return False
 
-            # Create test module file
-            test_file = temp_path / "test_verification.py"
-            with open(test_file, "w") as f:
-                # Add mock response handling based on examples
-                mock_code = """
-import pytest
-import json
-import unittest.mock as mock
-import requests
+        patches = dict.fromkeys(_MOCKED_REQUEST_FUNCTIONS, _mock_request())
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, self.execution_timeout)
+        try:
+            # Tests print freely; pytest would have captured their output
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(
+                io.StringIO()
+            ):
+                namespace: Dict[str, Any] = {"__name__": "verification_test"}
+                exec(code, namespace)
+
+                tests = []
+                for name, obj in namespace.items():
+                    if name.startswith("test") and inspect.isfunction(obj):
+                        if inspect.signature(obj).parameters:
+                            return None
+                        tests.append(obj)
+                    elif name.startswith("Test") and inspect.isclass(obj):
+                        # pytest doesn't collect classes with a constructor
+                        if obj.__init__ is not object.__init__:
+                            return None
+                        for method_name, method in inspect.getmembers(
+                            obj, inspect.isfunction
+                        ):
+                            if not method_name.startswith("test"):
+                                continue
+                            if len(inspect.signature(method).parameters) != 1:
+                                return None
+                            tests.append(functools.partial(_run_method, obj, method))
+
+                # A module without tests fails like an empty pytest run
+                if not tests:
+                    return False
+
+                with mock.patch.multiple(requests, **patches):
+                    for test in tests:
+                        test()
+            return True
+
+        except KeyboardInterrupt:
+            raise
+        except _VerificationTimeout:
+            print(f"Test verification timed out after {self.execution_timeout} seconds")
+            return False
+        except BaseException:
+            return False
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
 
-# Mock responses based on spec examples
-EXAMPLES = %s
+    def _verify_python_tests(
+        self, tests: List[GeneratedTestCode], examples_json: bytes
+    ) -> List[bool]:
+        """
+        Verify Python test code by executing it against examples.
 
-class MockResponse:
-    def __init__(self, status_code, json_data, headers=None):
-        self.status_code = status_code
-        self._json_data = json_data
-        self.headers = headers or {"Content-Type": "application/json"}
-        self.text = json.dumps(json_data) if json_data else ""
-    
-    def json(self):
-        return self._json_data
+        Every test is cached as its own module and pytest runs once for the
+        whole batch; results are mapped back to their test by module.
 
-# Mock requests to return examples
-@pytest.fixture(autouse=True)
-def mock_requests(monkeypatch):
-    def mock_request(*args, **kwargs):
-        # Default to 200 OK with empty response
-        return MockResponse(200, {})
-    
-    monkeypatch.setattr(requests, "request", mock_request)
-    monkeypatch.setattr(requests, "get", mock_request)
-    monkeypatch.setattr(requests, "post", mock_request)
-    monkeypatch.setattr(requests, "put", mock_request)
-    monkeypatch.setattr(requests, "patch", mock_request)
-    monkeypatch.setattr(requests, "delete", mock_request)
+        Args:
+            tests: Generated Python test code
+            examples_json: Example responses from API specification, as JSON
 
-""" % json.dumps(
-                    spec_examples
+        Returns:
+            One flag per test, in the same order as ``tests``, that is True if
+            the test passed verification
+        """
+        # Every batch reuses the run directory of this verifier
+        with self._run_lock:
+            temp_path = self._scratch
+            modules = self._materialize_tests(tests, examples_json, temp_path)
+
+            # Try running the tests with pytest
+            try:
+                passed_modules = self._run_pytest_batch(temp_path, modules)
+
+            except subprocess.TimeoutExpired:
+                print(
+                    "Test verification timed out after "
+                    f"{self.execution_timeout} seconds per test"
                 )
+                return [False] * len(tests)
+            except Exception as e:
+                print(f"Error during test verification: {e}")
+                traceback.print_exc()
+                return [False] * len(tests)
 
-                # Write the combined code
-                f.write(mock_code + "\n" + test_code.content)
+        return [module in passed_modules for module in modules]
 
-            # Try running the test with pytest
+    def _materialize_tests(
+        self,
+        tests: List[GeneratedTestCode],
+        examples_json: bytes,
+        temp_path: Path,
+    ) -> List[str]:
+        """
+        Cache one test module per test next to the shared mock conftest.py.
+
+        Modules are named by a digest of their content and only written when
+        missing; the cache is then trimmed back to its size limit. The
+        conftest.py reads the examples of the batch from examples.json in the
+        run directory.
+
+        Args:
+            tests: Generated Python test code
+            examples_json: Example responses from API specification, as JSON
+            temp_path: Run directory of the batch
+
+        Returns:
+            Module name of each test, in the same order as ``tests``
+        """
+        (temp_path / "examples.json").write_bytes(examples_json)
+
+        if not self._cache_ready:
+            self._module_dir.mkdir(parents=True, exist_ok=True)
+            _write_if_changed(self._module_dir / "pytest.ini", _PYTEST_INI.encode())
+            _write_if_changed(self._module_dir / "conftest.py", _MOCK_CONFTEST.encode())
+            self._cache_ready = True
+
+        modules = []
+        added = False
+        for test_code in tests:
+            content = test_code.content.encode()
+            digest = hashlib.blake2b(content, digest_size=20).hexdigest()
+            module_name = f"test_{digest}"
+            modules.append(module_name)
+            # Other processes share the cache and may have evicted the module
+            module_path = self._module_dir / f"{module_name}.py"
+            if not module_path.exists():
+                _write_if_changed(module_path, content)
+                added = True
+
+        if added:
             try:
-                # Add temp dir to Python path
-                sys.path.insert(0, str(temp_path))
+                _evict_modules(self._module_dir, set(modules))
+            except OSError as e:
+                print(f"Error in verifier module cache eviction: {e}")
 
-                # Run pytest on the file
-                result = pytest.main(["-xvs", str(test_file)])
+        return modules
 
-                # Check if tests passed
-                return result == 0  # pytest.ExitCode.OK
+    def _run_pytest_batch(self, temp_path: Path, modules: List[str]) -> Set[str]:
+        """
+        Run pytest over the given cached test modules.
 
-            except Exception as e:
-                print(f"Error during test verification: {e}")
-                traceback.print_exc()
-                return False
-            finally:
-                # Remove temp dir from Python path
-                if str(temp_path) in sys.path:
-                    sys.path.remove(str(temp_path))
+        pytest runs in a fresh interpreter, so no module, plugin or
+        monkeypatch state leaks between batches or into this process, and a
+        crashing test cannot take the caller down. With pytest-xdist a single
+        run spreads the modules over its workers; without it the modules are
+        split over up to parallel_workers pytest runs launched concurrently.
+
+        Args:
+            temp_path: Run directory of the batch
+            modules: Names of the cached test modules to run
+
+        Returns:
+            Names of the modules that ran at least one test and had no
+            failing or erroring test
+
+        Raises:
+            subprocess.TimeoutExpired: If a run exceeded its timeout
+        """
+        # Tests with identical content share their module
+        module_paths = [
+            str(self._module_dir / f"{module}.py") for module in dict.fromkeys(modules)
+        ]
+
+        workers = min(self.parallel_workers, len(module_paths))
+        if _XDIST_AVAILABLE or workers <= 1:
+            return self._run_pytest_chunk(temp_path, 0, module_paths, workers)
+
+        # The runs wait on their subprocess, so threads are enough to overlap
+        # them
+        chunks = [module_paths[k::workers] for k in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._run_pytest_chunk, temp_path, k, chunk, 1)
+                for k, chunk in enumerate(chunks)
+            ]
+            passed: Set[str] = set()
+            for future in futures:
+                passed |= future.result()
+        return passed
+
+    def _run_pytest_chunk(
+        self, temp_path: Path, index: int, module_paths: List[str], workers: int
+    ) -> Set[str]:
+        """
+        Run pytest once over some cached test modules.
+
+        Args:
+            temp_path: Run directory of the batch
+            index: Number of the run within the batch, naming its files
+            module_paths: Paths of the cached test modules to run
+            workers: Number of pytest-xdist workers to use when installed
+
+        Returns:
+            Names of the modules that ran at least one test and had no
+            failing or erroring test
+
+        Raises:
+            subprocess.TimeoutExpired: If the run exceeded its timeout
+        """
+        # Never read the report of a previous batch
+        report_path = temp_path / f"report-{index}.xml"
+        report_path.unlink(missing_ok=True)
+        args = [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-c",
+            str(self._module_dir / "pytest.ini"),
+            "--rootdir",
+            str(self._module_dir),
+            "-p",
+            "no:cacheprovider",
+            "--continue-on-collection-errors",
+            "--junitxml",
+            str(report_path),
+        ]
+
+        # Distribute modules over xdist workers when available; loadfile
+        # keeps each module's tests together on one worker
+        if _XDIST_AVAILABLE and workers > 1:
+            args.extend(["-n", str(workers), "--dist=loadfile"])
+
+        # Keep the output of the run in a log file in the run directory; pytest
+        # writes the bytecode of the modules next to them in the cache
+        env = {**os.environ, _EXAMPLES_ENV: str(temp_path / "examples.json")}
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        with open(temp_path / f"pytest-{index}.log", "wb") as log:
+            proc = subprocess.run(
+                [*args, *module_paths],
+                cwd=temp_path,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                timeout=self.execution_timeout * len(module_paths),
+                check=False,
+                env=env,
+            )
+
+        # Any other exit code means pytest itself failed, e.g. a usage error
+        if proc.returncode not in _PYTEST_RUN_CODES or not report_path.exists():
+            print(f"pytest exited with code {proc.returncode}")
+            return set()
+
+        passed: Set[str] = set()
+        failed: Set[str] = set()
+        for _, element in ElementTree.iterparse(report_path):
+            if element.tag != "testcase":
+                continue
+            # "test_0.TestC" for tests, "" with the module as name for
+            # collection errors
+            module = element.get("classname", "").partition(".")[0]
+            module = module or element.get("name", "")
+            if element.find("failure") is not None or element.find("error") is not None:
+                failed.add(module)
+            else:
+                passed.add(module)
+            element.clear()
+
+        return passed - failed
 
     def _verify_groovy_test(
         self, test_code: GeneratedTestCode, spec_examples: Dict[str, JSON]
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from .common import JSON
 
@@ -49,6 +49,10 @@ class GeneratedTestCode(BaseModel):
         description="Programming language of the generated test code (python or groovy)",
     )
     content: str = Field(..., description="Actual source code of the generated test")
+    python_equivalent: Optional[str] = Field(
+        None,
+        description="Python translation of a non-Python test, run in its place when present",
+    )
 
 
 class VerifiedTestCode(GeneratedTestCode):
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -76,3 +76,21 @@ class DashboardArtifact(BaseModel):
         default_factory=datetime.now,
         description="Timestamp when this dashboard was generated",
     )
+
+    def iter_chunks(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the dashboard as JSON-ready sections, one at a time.
+
+        The summary comes first, followed by one chunk per coverage report and
+        one per mismatch, so large dashboards can be written incrementally.
+        """
+        yield {
+            "section": "summary",
+            "generated_at": self.generated_at.isoformat(),
+            "coverage_report_count": len(self.coverage_reports),
+            "mismatch_count": len(self.mismatches),
+        }
+        for report in self.coverage_reports:
+            yield {"section": "coverage", **report.model_dump(mode="json")}
+        for mismatch in self.mismatches:
+            yield {"section": "mismatch", **mismatch.model_dump(mode="json")}